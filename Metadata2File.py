@@ -1,9 +1,19 @@
 import os
 import sys
 import shutil
+import collections
+import concurrent.futures
+import functools
+import importlib
+import importlib.util
+import json
+import multiprocessing
+import sqlite3
+import subprocess
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import threading
+import zipfile
 import time
 from datetime import datetime
 
@@ -12,18 +22,195 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 
-# File processing imports
-from PIL import Image
-from PIL.ExifTags import TAGS
-import PyPDF2
-import docx
-from pptx import Presentation
-import cv2
-import mutagen
-from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4
-from mutagen.flac import FLAC
-from mutagen.oggvorbis import OggVorbis
+# Helpers shared with main.py
+from fileops import fast_copy, lazy_import, probe_mp4
+
+# File signatures (magic bytes)
+_SIGNATURES = {
+    b'\xFF\xD8\xFF': ('Images', 'jpeg'),
+    b'\x89PNG\r\n\x1a\n': ('Images', 'png'),
+    b'GIF87a': ('Images', 'gif'),
+    b'GIF89a': ('Images', 'gif'),
+    b'BM': ('Images', 'bmp'),
+    b'ftypheic': ('Images', 'heic'),  # HEIC magic bytes
+    b'ftypheix': ('Images', 'heic'),  # HEIC variant
+    b'ftypmif1': ('Images', 'heic'),  # HEIC variant
+    b'ftypmsf1': ('Images', 'heic'),  # HEIC variant
+    b'RIFF': ('Videos', 'webp'),  # Could also be WAV
+    b'\x00\x00\x00\x18ftypmp4': ('Videos', 'mp4'),
+    b'\x00\x00\x00\x20ftypM4V': ('Videos', 'mp4'),
+    b'%PDF': ('Documents', 'pdf'),
+    b'PK\x03\x04': ('Archives', 'zip'),  # Refined into docx/pptx/xlsx by _classify_zip
+    b'ID3': ('Audio', 'mp3'),
+    b'\xFF\xFB': ('Audio', 'mp3'),
+    b'\xFF\xF3': ('Audio', 'mp3'),
+    b'fLaC': ('Audio', 'flac'),
+    b'OggS': ('Audio', 'ogg'),
+    b'PK': ('Archives', 'zip'),
+    b'Rar!': ('Archives', 'rar'),
+    b'7z\xBC\xAF\'27\x1C': ('Archives', '7z'),
+    b'MZ': ('Executables', 'exe'),
+}
+
+# Signatures grouped by length so detection is one dict lookup per distinct length
+_SIGNATURES_BY_LENGTH: Dict[int, Dict[bytes, Tuple[str, str]]] = {}
+for _sig, _match in _SIGNATURES.items():
+    _SIGNATURES_BY_LENGTH.setdefault(len(_sig), {})[_sig] = _match
+_SIGNATURE_LENGTHS = sorted(_SIGNATURES_BY_LENGTH, reverse=True)
+del _sig, _match
+
+# Signatures as (sig, match) rows in the same longest-first order, for batch matching
+_SIGNATURE_ROWS = [(sig, match) for length in _SIGNATURE_LENGTHS
+                   for sig, match in _SIGNATURES_BY_LENGTH[length].items()]
+_HEADER_SIZE = 32
+
+# PK\x03\x04 files are ZIP containers; these entries identify the Office formats inside
+_ZIP_MATCH = _SIGNATURES[b'PK\x03\x04']
+_ZIP_MARKERS = (
+    ('word/document.xml', ('Documents', 'docx')),
+    ('ppt/presentation.xml', ('Documents', 'pptx')),
+    ('xl/workbook.xml', ('Documents', 'xlsx')),
+)
+
+# Detection result for files matched by neither signature nor extension
+_UNKNOWN_TYPE = ('Other', 'unknown', "unknown")
+
+
+def _match_signature(header: bytes) -> Optional[Tuple[str, str]]:
+    """Return (category, format_type) for the longest signature the header starts with"""
+    for length in _SIGNATURE_LENGTHS:
+        match = _SIGNATURES_BY_LENGTH[length].get(header[:length])
+        if match:
+            return match
+    return None
+
+
+def _match_signatures_batch(headers: List[bytes]) -> List[Optional[Tuple[str, str]]]:
+    """Match many headers at once by comparing a (N, 32) byte matrix against each signature"""
+    try:
+        import numpy as np
+    except ImportError:
+        return [_match_signature(header) for header in headers]
+    
+    if not headers:
+        return []
+    
+    arr = np.frombuffer(b"".join(header.ljust(_HEADER_SIZE, b'\0') for header in headers),
+                        dtype=np.uint8).reshape(-1, _HEADER_SIZE)
+    lengths = np.fromiter((len(header) for header in headers), dtype=np.intp, count=len(headers))
+    
+    # Index into _SIGNATURE_ROWS per header; the first (longest) signature that matches wins
+    matched = np.full(len(headers), -1, dtype=np.intp)
+    for i, (sig, _) in enumerate(_SIGNATURE_ROWS):
+        sig_arr = np.frombuffer(sig, dtype=np.uint8)
+        mask = (arr[:, :len(sig)] == sig_arr).all(axis=1)
+        # Padding must not complete a signature for headers shorter than it
+        mask &= (lengths >= len(sig)) & (matched < 0)
+        matched[mask] = i
+    
+    return [_SIGNATURE_ROWS[i][1] if i >= 0 else None for i in matched.tolist()]
+
+
+# Raw, unbuffered read flags; O_NOATIME skips the atime update on Linux when we own the file
+_HEADER_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+_HEADER_NOATIME = getattr(os, 'O_NOATIME', 0)
+
+
+def _read_header(file_path: str, size: int = 32) -> bytes:
+    """Read the first bytes of a file without setting up a buffered file object"""
+    try:
+        fd = os.open(file_path, _HEADER_OPEN_FLAGS | _HEADER_NOATIME)
+    except PermissionError:
+        # O_NOATIME is only allowed for the file's owner
+        if not _HEADER_NOATIME:
+            raise
+        fd = os.open(file_path, _HEADER_OPEN_FLAGS)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+# ISO base media containers whose moov atom can be parsed directly
+_MP4_EXTENSIONS = ('.mp4', '.mov', '.m4v')
+
+@functools.lru_cache(maxsize=None)
+def _ffprobe_path() -> Optional[str]:
+    """Locate the ffprobe executable once"""
+    return shutil.which('ffprobe')
+
+
+def _probe_ffprobe(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, fps) of the first video stream with ffprobe, if it is installed"""
+    ffprobe = _ffprobe_path()
+    if not ffprobe:
+        return None
+    
+    try:
+        result = subprocess.run(
+            [ffprobe, '-v', 'quiet', '-print_format', 'json', '-show_streams',
+             '-select_streams', 'v:0', file_path],
+            capture_output=True, timeout=30
+        )
+        streams = json.loads(result.stdout or b'{}').get('streams')
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+    if result.returncode != 0 or not streams:
+        return None
+    
+    stream = streams[0]
+    num, _, den = (stream.get('avg_frame_rate') or '0/0').partition('/')
+    try:
+        fps = int(int(num) / int(den)) if den and int(den) else 0
+        return int(stream['width']), int(stream['height']), fps
+    except (KeyError, ValueError):
+        return None
+
+
+# Persistent cache for extracted metadata, keyed by path, mtime and size
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.metadata2file.cache')
+
+# Values the get_*_info methods return when extraction fails - never cached
+_UNCACHED_INFO = ('unknown', 'document')
+
+# Rows kept in the on-disk cache - the oldest entries (e.g. for moved or edited files) are pruned
+_CACHE_MAX_ROWS = 200000
+
+
+def _cached_info(extract):
+    """Serve a get_*_info result from the metadata caches while the file is unchanged"""
+    @functools.wraps(extract)
+    def wrapper(self, file_path: str, st: Optional[os.stat_result] = None) -> str:
+        # Callers that walked the folder with scandir already have the stat result
+        if st is None:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return extract(self, file_path)
+        key = f"{extract.__name__}|{os.path.abspath(file_path)}|{st.st_mtime_ns}|{st.st_size}"
+        
+        # In-memory results from this run first, then the on-disk cache
+        info = self._info_memo.get(key)
+        if info is not None:
+            return info
+        if self._meta_cache is not None:
+            try:
+                row = self._meta_cache.execute(
+                    "SELECT info FROM metadata WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row:
+                self._info_memo[key] = row[0]
+                return row[0]
+        
+        info = extract(self, file_path)
+        if info not in _UNCACHED_INFO:
+            self._info_memo[key] = info
+            if self._meta_cache is not None:
+                # Written in one transaction per batch by flush_cache, not one commit per file
+                self._cache_rows.append((key, info))
+        return info
+    return wrapper
 
 
 class FileProcessor:
@@ -38,84 +225,156 @@ class FileProcessor:
         'Executables': ['.exe', '.msi', '.dmg', '.deb', '.rpm']
     }
     
-    def __init__(self):
+    # Flat extension -> full detection result for the extension fallback
+    _EXT_INFO: Dict[str, Tuple[str, str, str]] = {
+        sys.intern(ext): (category, sys.intern(ext[1:]), "file_extension")
+        for category, extensions in SUPPORTED_FORMATS.items()
+        for ext in extensions
+    }
+    
+    def __init__(self, cache_path: Optional[str] = DEFAULT_CACHE_PATH):
         self.processed_files = []
         self.errors = []
         self.file_stats = {}
+        self._cache_path = cache_path
+        self._meta_cache = self._open_cache(cache_path) if cache_path else None
+        self._info_memo: Dict[str, str] = {}
+        self._cache_rows: List[Tuple[str, str]] = []
+        self._zip_kind_memo: Dict[Tuple[str, int, int], Tuple[str, str]] = {}
+        self._used_names: Dict[str, Set[str]] = {}
     
-    def detect_file_type(self, file_path: str) -> Tuple[str, str, str]:
-        """Detect file type by reading file signature/magic bytes"""
-        filename = os.path.basename(file_path)
-        file_size = 0
-        detection_method = "unknown"
+    def _open_cache(self, cache_path: str) -> Optional[sqlite3.Connection]:
+        """Open the metadata cache - SQLite so parallel workers can share it safely"""
+        try:
+            conn = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+            # WAL lets other workers keep reading while a batch commits; NORMAL skips the fsync per commit
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, info TEXT)")
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            print(f"Metadata cache disabled ({cache_path}): {str(e)}")
+            return None
+    
+    def flush_cache(self):
+        """Write the metadata extracted since the last flush to the cache in one transaction"""
+        rows, self._cache_rows = self._cache_rows, []
+        if rows and self._meta_cache is not None:
+            try:
+                with self._meta_cache:
+                    self._meta_cache.executemany(
+                        "INSERT OR REPLACE INTO metadata (key, info) VALUES (?, ?)", rows)
+            except sqlite3.Error:
+                pass
+    
+    def prune_cache(self):
+        """Drop all but the newest _CACHE_MAX_ROWS cache entries"""
+        if self._meta_cache is None:
+            return
+        try:
+            # Rewritten rows get a new rowid, so rowid order is insertion order
+            with self._meta_cache:
+                self._meta_cache.execute(
+                    "DELETE FROM metadata WHERE rowid <= (SELECT MAX(rowid) FROM metadata) - ?",
+                    (_CACHE_MAX_ROWS,))
+        except sqlite3.Error:
+            pass
+    
+    def close(self):
+        """Close the metadata cache"""
+        if self._meta_cache is not None:
+            self.flush_cache()
+            self._meta_cache.close()
+            self._meta_cache = None
+    
+    def _classify(self, file_path: str, match: Optional[Tuple[str, str]],
+                  st: Optional[os.stat_result] = None) -> Tuple[str, str, str]:
+        """Turn a magic-bytes match (or None) into (category, format_type, detection_method)"""
+        if match:
+            if match == _ZIP_MATCH:
+                match = self._classify_zip(file_path, st)
+            category, format_type = match
+            return category, format_type, "magic_bytes"
         
+        # Check by file extension as fallback, unknown file type otherwise
+        return self._EXT_INFO.get(os.path.splitext(file_path)[1].lower(), _UNKNOWN_TYPE)
+    
+    def _classify_zip(self, file_path: str, st: Optional[os.stat_result] = None) -> Tuple[str, str]:
+        """Tell Office documents from plain ZIP archives by their central directory entries"""
         try:
-            file_size = os.path.getsize(file_path)
-            
-            with open(file_path, 'rb') as f:
-                header = f.read(32)
-            
-            # File signatures (magic bytes)
-            signatures = {
-                b'\xFF\xD8\xFF': ('Images', 'jpeg'),
-                b'\x89PNG\r\n\x1a\n': ('Images', 'png'),
-                b'GIF87a': ('Images', 'gif'),
-                b'GIF89a': ('Images', 'gif'),
-                b'BM': ('Images', 'bmp'),
-                b'ftypheic': ('Images', 'heic'),  # HEIC magic bytes
-                b'ftypheix': ('Images', 'heic'),  # HEIC variant
-                b'ftypmif1': ('Images', 'heic'),  # HEIC variant
-                b'ftypmsf1': ('Images', 'heic'),  # HEIC variant
-                b'RIFF': ('Videos', 'webp'),  # Could also be WAV
-                b'\x00\x00\x00\x18ftypmp4': ('Videos', 'mp4'),
-                b'\x00\x00\x00\x20ftypM4V': ('Videos', 'mp4'),
-                b'%PDF': ('Documents', 'pdf'),
-                b'PK\x03\x04': ('Documents', 'office'),  # ZIP-based (docx, pptx)
-                b'ID3': ('Audio', 'mp3'),
-                b'\xFF\xFB': ('Audio', 'mp3'),
-                b'\xFF\xF3': ('Audio', 'mp3'),
-                b'fLaC': ('Audio', 'flac'),
-                b'OggS': ('Audio', 'ogg'),
-                b'PK': ('Archives', 'zip'),
-                b'Rar!': ('Archives', 'rar'),
-                b'7z\xBC\xAF\'27\x1C': ('Archives', '7z'),
-                b'MZ': ('Executables', 'exe'),
-            }
-            
-            # Check file signatures first
-            for sig, (category, format_type) in signatures.items():
-                if header.startswith(sig):
-                    detection_method = "magic_bytes"
-                    return category, format_type, detection_method
-            
-            # Check by file extension as fallback
-            ext = Path(file_path).suffix.lower()
-            for category, extensions in self.SUPPORTED_FORMATS.items():
-                if ext in extensions:
-                    detection_method = "file_extension"
-                    format_type = ext[1:]  # Remove the dot
-                    return category, format_type, detection_method
+            if st is None:
+                st = os.stat(file_path)
+            key = (file_path, st.st_mtime_ns, st.st_size)
+            kind = self._zip_kind_memo.get(key)
+            if kind is None:
+                with zipfile.ZipFile(file_path) as zf:
+                    names = set(zf.namelist())
+                kind = next((kind for marker, kind in _ZIP_MARKERS if marker in names), _ZIP_MATCH)
+                self._zip_kind_memo[key] = kind
+            return kind
+        except (OSError, zipfile.BadZipFile):
+            return _ZIP_MATCH
+    
+    def detect_file_type(self, file_path: str,
+                         st: Optional[os.stat_result] = None) -> Tuple[str, str, str]:
+        """Detect file type by reading file signature/magic bytes"""
+        try:
+            header = _read_header(file_path, _HEADER_SIZE)
             
-            # Unknown file type
-            detection_method = "unknown"
-            return 'Other', 'unknown', detection_method
+            return self._classify(file_path, _match_signature(header), st)
             
         except Exception as e:
-            detection_method = "error"
-            return 'Error', str(e), detection_method
+            return 'Error', str(e), "error"
+    
+    def detect_file_types(self, file_paths: List[str],
+                          stats: Optional[List[Optional[os.stat_result]]] = None) -> List[Tuple[str, str, str]]:
+        """Detect file types for a batch of files, matching all headers in one pass"""
+        if stats is None:
+            stats = [None] * len(file_paths)
+        headers = []
+        errors = {}
+        for i, file_path in enumerate(file_paths):
+            try:
+                headers.append(_read_header(file_path, _HEADER_SIZE))
+            except Exception as e:
+                headers.append(b'')
+                errors[i] = str(e)
+        
+        matches = _match_signatures_batch(headers)
+        
+        return [('Error', errors[i], "error") if i in errors
+                else self._classify(file_path, matches[i], stats[i])
+                for i, file_path in enumerate(file_paths)]
     
+    @_cached_info
     def get_image_info(self, file_path: str) -> str:
         """Get basic image information"""
         try:
+            # Image.open only parses the header; size and format are available without decoding
+            Image = lazy_import('PIL.Image')
             with Image.open(file_path) as img:
-                info = f"{img.size[0]}x{img.size[1]}_{img.format}"
-                return info
+                width, height = img.size
+                image_format = img.format
+            return f"{width}x{height}_{image_format}"
         except Exception as e:
             return "unknown"
     
+    @_cached_info
     def get_video_info(self, file_path: str) -> str:
         """Get basic video information"""
         try:
+            # Container headers give size and frame rate without initialising any codec
+            probed = None
+            if os.path.splitext(file_path)[1].lower() in _MP4_EXTENSIONS:
+                probed = probe_mp4(file_path)
+            if probed is None:
+                probed = _probe_ffprobe(file_path)
+            if probed is not None:
+                width, height, fps = probed
+                return f"{width}x{height}_{fps}fps"
+            
+            cv2 = lazy_import('cv2')
             cap = cv2.VideoCapture(file_path)
             if cap.isOpened():
                 width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -128,10 +387,11 @@ class FileProcessor:
         except Exception as e:
             return "unknown"
     
+    @_cached_info
     def get_audio_info(self, file_path: str) -> str:
         """Get basic audio information"""
         try:
-            audio_file = mutagen.File(file_path)
+            audio_file = lazy_import('mutagen').File(file_path)
             if audio_file and hasattr(audio_file, 'info'):
                 duration = int(audio_file.info.length)
                 bitrate = getattr(audio_file.info, 'bitrate', 0)
@@ -141,54 +401,71 @@ class FileProcessor:
         except Exception as e:
             return "unknown"
     
+    @_cached_info
     def get_document_info(self, file_path: str) -> str:
         """Get basic document information"""
-        ext = Path(file_path).suffix.lower()
+        ext = os.path.splitext(file_path)[1].lower()
         try:
             info = "document"
             if ext == '.pdf':
                 with open(file_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
+                    reader = lazy_import('PyPDF2').PdfReader(f)
                     info = f"{len(reader.pages)}pages"
             elif ext in ['.docx', '.doc']:
-                doc = docx.Document(file_path)
+                doc = lazy_import('docx').Document(file_path)
                 info = f"{len(doc.paragraphs)}paragraphs"
             elif ext in ['.pptx', '.ppt']:
-                prs = Presentation(file_path)
+                prs = lazy_import('pptx').Presentation(file_path)
                 info = f"{len(prs.slides)}slides"
             elif ext == '.txt':
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = len(f.readlines())
-                    info = f"{lines}lines"
+                # Count newlines in raw 1 MiB chunks instead of decoding every line
+                lines = 0
+                last_chunk = b''
+                with open(file_path, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        lines += chunk.count(b'\n')
+                        last_chunk = chunk
+                # A final line without a trailing newline still counts
+                if last_chunk and not last_chunk.endswith(b'\n'):
+                    lines += 1
+                info = f"{lines}lines"
             
             return info
         except Exception as e:
             return "document"
     
-    def create_organized_filename(self, file_path: str, category: str) -> str:
-        """Create an organized filename with metadata info"""
-        original_name = Path(file_path).stem
-        extension = Path(file_path).suffix  # Keep original case of extension
+    def create_organized_filename(self, file_path: str, category: str, format_type: str,
+                                  metadata_categories: Optional[Set[str]] = None,
+                                  stem: Optional[str] = None, extension: Optional[str] = None,
+                                  st: Optional[os.stat_result] = None) -> str:
+        """Create an organized filename with metadata info
+        
+        stem, extension and st may be passed in when the caller already has them.
+        """
+        if stem is None or extension is None:
+            # Keep original case of extension
+            stem, extension = os.path.splitext(os.path.basename(file_path))
+        original_name = stem
         
         # Ensure extension exists
         if not extension:
-            # Try to determine extension from detected format
-            _, format_type, _ = self.detect_file_type(file_path)
+            # Use the format already detected by the caller
             if format_type and format_type != 'unknown':
                 extension = f".{format_type}"
             else:
                 extension = ".unknown"
         
-        # Get file info based on category
+        # Get file info based on category, only for categories the user opted into
         info = ""
-        if category == 'Images':
-            info = self.get_image_info(file_path)
-        elif category == 'Videos':
-            info = self.get_video_info(file_path)
-        elif category == 'Audio':
-            info = self.get_audio_info(file_path)
-        elif category == 'Documents':
-            info = self.get_document_info(file_path)
+        if metadata_categories is None or category in metadata_categories:
+            if category == 'Images':
+                info = self.get_image_info(file_path, st)
+            elif category == 'Videos':
+                info = self.get_video_info(file_path, st)
+            elif category == 'Audio':
+                info = self.get_audio_info(file_path, st)
+            elif category == 'Documents':
+                info = self.get_document_info(file_path, st)
         
         # Create organized filename - ALWAYS include extension
         if info and info != "unknown":
@@ -198,27 +475,155 @@ class FileProcessor:
         
         return new_filename
     
-    def get_all_files_from_folder(self, input_folder: str) -> List[str]:
-        """Get all files from folder and all its subfolders"""
-        files = []
-        
+    def _iter_file_entries(self, input_folder: str) -> Iterator[os.DirEntry]:
+        """Yield a DirEntry for every file in folder and all its subfolders"""
         try:
-            # Walk through all directories and subdirectories
-            for root, dirs, filenames in os.walk(input_folder):
-                for filename in filenames:
-                    file_path = os.path.join(root, filename)
-                    files.append(file_path)
-        except Exception as e:
+            # scandir exposes the entry type from the directory listing, so no stat() per entry
+            with os.scandir(input_folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            yield from self._iter_file_entries(entry.path)
+                    else:
+                        yield entry
+        except OSError as e:
             print(f"Error scanning folder {input_folder}: {str(e)}")
+    
+    def get_all_files_from_folder(self, input_folder: str) -> Iterator[str]:
+        """Yield all files from folder and all its subfolders"""
+        for entry in self._iter_file_entries(input_folder):
+            yield entry.path
+    
+    def iter_files_with_stat(self, input_folder: str) -> Iterator[Tuple[str, Optional[os.stat_result]]]:
+        """Yield (path, stat) for all files in folder and its subfolders
+        
+        The stat comes from the DirEntry (free on Windows, cached everywhere) and is passed
+        downstream so detection and the metadata cache don't stat the file again.
+        """
+        for entry in self._iter_file_entries(input_folder):
+            try:
+                st = entry.stat()
+            except OSError:
+                # e.g. a broken symlink - let detection report the error
+                st = None
+            yield entry.path, st
+    
+    def _claim_destination(self, dest_folder: str, new_filename: str) -> str:
+        """Reserve a unique destination path, adding a counter for duplicates"""
+        # Names already in the folder are listed once, so collisions are resolved in memory
+        used = self._used_names.get(dest_folder)
+        if used is None:
+            # First file for this folder in this worker - create it once, so only folders
+            # that actually receive files exist
+            os.makedirs(dest_folder, exist_ok=True)
+            used = self._used_names[dest_folder] = set(os.listdir(dest_folder))
+        
+        counter = 1
+        base_name, ext = os.path.splitext(new_filename)
+        
+        while True:
+            if new_filename not in used:
+                dest_path = os.path.join(dest_folder, new_filename)
+                # O_EXCL makes the reservation atomic, so parallel workers never pick the same name
+                try:
+                    fd = os.open(dest_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                except FileExistsError:
+                    pass
+                else:
+                    os.close(fd)
+                    used.add(new_filename)
+                    return dest_path
+                # Another worker got there first
+                used.add(new_filename)
+            new_filename = f"{base_name}_{counter}{ext}"
+            counter += 1
+    
+    def process_single_file(self, file_path: str, output_folder: str,
+                            organize_by_type: bool = True,
+                            add_metadata_to_filename: bool = True,
+                            metadata_categories: Optional[Set[str]] = None,
+                            detection: Optional[Tuple[str, str, str]] = None,
+                            st: Optional[os.stat_result] = None) -> Tuple[str, str]:
+        """Detect, rename and copy one file - returns (category, dest_path)"""
+        # Detect file type, unless the caller already did it as part of a batch
+        if detection is None:
+            detection = self.detect_file_type(file_path, st)
+        category, format_type, detection_method = detection
+        
+        # Create destination folder
+        if organize_by_type:
+            dest_folder = os.path.join(output_folder, category)
+        else:
+            dest_folder = output_folder
+        
+        # Create filename (with or without metadata) - ALWAYS preserve extension
+        original_name, original_extension = os.path.splitext(os.path.basename(file_path))
+        
+        # Ensure extension exists
+        if not original_extension:
+            # Try to determine extension from detected format
+            if format_type and format_type != 'unknown':
+                original_extension = f".{format_type}"
+            else:
+                original_extension = ".unknown"
+        
+        if add_metadata_to_filename:
+            new_filename = self.create_organized_filename(file_path, category, format_type,
+                                                          metadata_categories,
+                                                          original_name, original_extension, st)
+        else:
+            # Even without metadata, ensure extension is preserved
+            new_filename = f"{original_name}{original_extension}"
+        
+        # Handle duplicate filenames
+        dest_path = self._claim_destination(dest_folder, new_filename)
+        
+        # Copy the file
+        try:
+            fast_copy(file_path, dest_path)
+        except Exception:
+            # Release the reserved name so a failed copy leaves nothing behind
+            os.remove(dest_path)
+            raise
         
-        return files
+        return category, dest_path
+    
+    def _run_batches(self, batches: Iterator[Tuple], workers: int,
+                     use_processes: bool) -> Iterator[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+        """Run _process_batch over the batches in a process or thread pool, yielding per-file results"""
+        # Workers build their FileProcessor with this processor's cache (or none)
+        if use_processes:
+            with multiprocessing.Pool(workers, initializer=_init_worker,
+                                      initargs=(self._cache_path,)) as pool:
+                for batch_results in pool.imap_unordered(_process_batch, batches):
+                    yield from batch_results
+        else:
+            created = []
+            results = _imap_threaded(_process_batch, batches, workers,
+                                     initializer=_init_worker, initargs=(self._cache_path, created))
+            try:
+                for batch_results in results:
+                    yield from batch_results
+            finally:
+                # Wait for the worker threads to finish, then close their cache connections
+                results.close()
+                for processor in created:
+                    processor.close()
     
     def process_and_organize_files(self, input_folder: str, output_folder: str, 
                                  organize_by_type: bool = True, 
                                  add_metadata_to_filename: bool = True,
                                  progress_callback=None,
-                                 log_callback=None) -> Dict:
-        """Process files and organize them in output folder"""
+                                 log_callback=None,
+                                 workers: Optional[int] = None,
+                                 metadata_categories: Optional[Set[str]] = None,
+                                 use_processes: Optional[bool] = None) -> Dict:
+        """Process files and organize them in output folder
+        
+        metadata_categories limits metadata extraction to the given categories (None means all).
+        use_processes picks a process pool over a thread pool (default: processes except on Windows).
+        """
         
         if log_callback:
             log_callback(f"🔍 Scanning input folder and all subfolders: {input_folder}")
@@ -231,96 +636,155 @@ class FileProcessor:
             'subfolders_scanned': 0
         }
         
-        # Get all files from input folder and subfolders
-        files = self.get_all_files_from_folder(input_folder)
+        if use_processes is None:
+            use_processes = sys.platform != 'win32'
+        if not workers:
+            # Threads mostly wait on I/O, so they can outnumber the cores
+            workers = os.cpu_count() if use_processes else min(32, (os.cpu_count() or 1) + 4)
+        batch_size = 128
         
-        # Count unique subfolders scanned
+        # Bound how far enumeration may run ahead of the workers
+        pending = threading.Semaphore(batch_size * workers * 4)
+        # Set when the consumer stops early, so a scan blocked on the semaphore gives up
+        # (a Pool's task handler runs iter_batches, and terminate() waits for it)
+        stop_scan = threading.Event()
+        files_found = 0
         subfolders = set()
-        for file_path in files:
-            subfolder = os.path.dirname(file_path)
-            subfolders.add(subfolder)
-        
-        results['total_files'] = len(files)
-        results['subfolders_scanned'] = len(subfolders)
         
-        if log_callback:
-            log_callback(f"📁 Found {len(subfolders)} folders with {len(files)} files to process")
+        def iter_batches():
+            nonlocal files_found
+            # Files stream straight from the folder scan into the pool, so processing starts immediately
+            paths, stats = [], []
+            for file_path, st in self.iter_files_with_stat(input_folder):
+                while not pending.acquire(timeout=0.1):
+                    if stop_scan.is_set():
+                        return
+                files_found += 1
+                paths.append(file_path)
+                stats.append(st)
+                if len(paths) == batch_size:
+                    yield (paths, stats, output_folder, organize_by_type, add_metadata_to_filename,
+                           metadata_categories)
+                    paths, stats = [], []
+            if paths:
+                yield (paths, stats, output_folder, organize_by_type, add_metadata_to_filename,
+                       metadata_categories)
         
-        for i, file_path in enumerate(files):
-            try:
+        # Each file is independent, so detection, metadata parsing and copying run in parallel.
+        # The generator is held here so the scan is told to stop before the pool shuts down
+        batch_results = self._run_batches(iter_batches(), workers, use_processes)
+        try:
+            for file_path, category, dest_path, error in batch_results:
+                pending.release()
+                results['total_files'] += 1
+                # Split the path once; every per-file message below reuses the parts
+                folder, filename = os.path.split(file_path)
+                subfolders.add(folder)
+                
                 if progress_callback:
-                    progress_callback(i + 1, len(files), os.path.basename(file_path))
+                    progress_callback(results['total_files'], files_found, filename)
                 
                 # Get relative path from input folder to maintain folder structure info
-                relative_path = os.path.relpath(file_path, input_folder)
-                subfolder_name = os.path.dirname(relative_path)
+                subfolder_name = os.path.relpath(folder, input_folder)
+                if subfolder_name == os.curdir:
+                    subfolder_name = ''
                 
                 if log_callback and subfolder_name:
                     log_callback(f"📂 Processing from subfolder: {subfolder_name}")
                 
-                # Detect file type
-                category, format_type, detection_method = self.detect_file_type(file_path)
-                
-                # Create destination folder
-                if organize_by_type:
-                    dest_folder = os.path.join(output_folder, category)
+                if error is None:
+                    # Update statistics
+                    if category not in results['categories']:
+                        results['categories'][category] = 0
+                    results['categories'][category] += 1
+                    results['processed_files'] += 1
                 else:
-                    dest_folder = output_folder
-                
-                os.makedirs(dest_folder, exist_ok=True)
-                
-                # Create filename (with or without metadata) - ALWAYS preserve extension
-                original_filename = os.path.basename(file_path)
-                original_name = Path(file_path).stem
-                original_extension = Path(file_path).suffix
-                
-                # Ensure extension exists
-                if not original_extension:
-                    # Try to determine extension from detected format
-                    if format_type and format_type != 'unknown':
-                        original_extension = f".{format_type}"
-                    else:
-                        original_extension = ".unknown"
-                
-                if add_metadata_to_filename:
-                    new_filename = self.create_organized_filename(file_path, category)
-                else:
-                    # Even without metadata, ensure extension is preserved
-                    new_filename = f"{original_name}{original_extension}"
-                
-                # Handle duplicate filenames
-                dest_path = os.path.join(dest_folder, new_filename)
-                counter = 1
-                base_name, ext = os.path.splitext(new_filename)
+                    error_info = {
+                        'file_path': file_path,
+                        'error': error,
+                        'timestamp': datetime.now().isoformat()
+                    }
+                    results['errors'].append(error_info)
                 
-                while os.path.exists(dest_path):
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    dest_path = os.path.join(dest_folder, new_filename)
-                    counter += 1
-                
-                # Copy the file
-                shutil.copy2(file_path, dest_path)
-                
-                # Update statistics
-                if category not in results['categories']:
-                    results['categories'][category] = 0
-                results['categories'][category] += 1
-                results['processed_files'] += 1
-                
-            except Exception as e:
-                error_info = {
-                    'file_path': file_path,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                }
-                results['errors'].append(error_info)
-                
-                if log_callback:
-                    log_callback(f"❌ Error processing {os.path.basename(file_path)}: {str(e)}")
+                    if log_callback:
+                        log_callback(f"❌ Error processing {filename}: {error}")
+        finally:
+            stop_scan.set()
+            batch_results.close()
+        
+        results['subfolders_scanned'] = len(subfolders)
+        
+        self.flush_cache()
+        self.prune_cache()
+        
+        if log_callback:
+            log_callback(f"📁 Scanned {len(subfolders)} folders with {results['total_files']} files")
         
         return results
 
 
+# Per-process (or per-thread) FileProcessor used by the workers
+_worker_state = threading.local()
+
+
+def _init_worker(cache_path: Optional[str], created: Optional[List[FileProcessor]] = None):
+    """Pool initializer - give the worker process or thread its own FileProcessor"""
+    processor = _worker_state.processor = FileProcessor(cache_path)
+    if created is not None:
+        created.append(processor)
+
+
+def _get_worker_processor() -> FileProcessor:
+    """Return the FileProcessor for the current worker process or thread"""
+    processor = getattr(_worker_state, 'processor', None)
+    if processor is None:
+        processor = _worker_state.processor = FileProcessor()
+    return processor
+
+
+def _imap_threaded(func, tasks: Iterator, workers: int, initializer=None, initargs=()) -> Iterator:
+    """Unordered map over a thread pool that keeps at most workers * 2 tasks in flight"""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers, initializer=initializer,
+                                               initargs=initargs) as executor:
+        in_flight = set()
+        for task in tasks:
+            in_flight.add(executor.submit(func, task))
+            if len(in_flight) >= workers * 2:
+                done, in_flight = concurrent.futures.wait(
+                    in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in concurrent.futures.as_completed(in_flight):
+            yield future.result()
+
+
+def _process_batch(task: Tuple[List[str], List[Optional[os.stat_result]], str, bool, bool,
+                               Optional[Set[str]]]
+                   ) -> List[Tuple[str, Optional[str], Optional[str], Optional[str]]]:
+    """Process a batch of files in a worker - returns (file_path, category, dest_path, error) per file"""
+    (file_paths, stats, output_folder, organize_by_type, add_metadata_to_filename,
+     metadata_categories) = task
+    
+    processor = _get_worker_processor()
+    
+    # Magic bytes for the whole batch are matched together
+    detections = processor.detect_file_types(file_paths, stats)
+    
+    results = []
+    for file_path, st, detection in zip(file_paths, stats, detections):
+        try:
+            category, dest_path = processor.process_single_file(
+                file_path, output_folder, organize_by_type, add_metadata_to_filename,
+                metadata_categories=metadata_categories, detection=detection, st=st
+            )
+            results.append((file_path, category, dest_path, None))
+        except Exception as e:
+            results.append((file_path, None, None, str(e)))
+    
+    processor.flush_cache()
+    return results
+
+
 class FileOrganizerGUI:
     """Beautiful GUI for the file organizer"""
     
@@ -331,9 +795,21 @@ class FileOrganizerGUI:
         self.output_folder = tk.StringVar()
         self.organize_by_type = tk.BooleanVar(value=True)
         self.add_metadata_to_filename = tk.BooleanVar(value=True)
+        self.metadata_categories = {
+            'Images': tk.BooleanVar(value=True),
+            'Videos': tk.BooleanVar(value=True),
+            'Audio': tk.BooleanVar(value=True),
+            'Documents': tk.BooleanVar(value=True)
+        }
         self.processing = False
         
+        # Log lines and progress are queued by any thread and flushed by the Tk loop
+        self._log_queue = collections.deque()
+        self._log_lock = threading.Lock()
+        self._pending_progress = None
+        
         self.setup_gui()
+        self.root.after(100, self._drain_log_queue)
     
     def setup_gui(self):
         """Setup the GUI interface"""
@@ -391,6 +867,18 @@ class FileOrganizerGUI:
         ttk.Checkbutton(options_frame, text="Add metadata info to filenames (size, duration, etc.)",
                        variable=self.add_metadata_to_filename).grid(row=1, column=0, sticky=tk.W, pady=2)
         
+        # Per-category metadata toggles - unticked categories are never parsed
+        metadata_labels = {
+            'Images': "Include image resolution",
+            'Videos': "Include video resolution and frame rate",
+            'Audio': "Include audio duration and bitrate",
+            'Documents': "Include document page, paragraph, slide and line counts"
+        }
+        for row, (category, label) in enumerate(metadata_labels.items(), start=2):
+            ttk.Checkbutton(options_frame, text=label,
+                           variable=self.metadata_categories[category]).grid(
+                row=row, column=0, sticky=tk.W, padx=(20, 0), pady=2)
+        
         # Control buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=6, column=0, columnspan=3, pady=(0, 20))
@@ -472,20 +960,49 @@ class FileOrganizerGUI:
         if self.output_folder.get() and os.path.exists(self.output_folder.get()):
             if sys.platform == "win32":
                 os.startfile(self.output_folder.get())
-            elif sys.platform == "darwin":
-                os.system(f"open '{self.output_folder.get()}'")
             else:
-                os.system(f"xdg-open '{self.output_folder.get()}'")
+                # No shell involved, so quotes in the path can't break the command
+                opener = "open" if sys.platform == "darwin" else "xdg-open"
+                subprocess.Popen([opener, self.output_folder.get()], close_fds=True)
             self.log(f"📁 Opened output folder: {self.output_folder.get()}")
         else:
             messagebox.showwarning("Warning", "Output folder not set or doesn't exist")
     
     def log(self, message):
-        """Add message to log"""
+        """Add message to log (queued, safe to call from the worker thread)"""
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        with self._log_lock:
+            self._log_queue.append(f"[{timestamp}] {message}\n")
+    
+    def set_progress(self, progress=None, status=None):
+        """Queue a progress bar value and/or status text (None leaves it unchanged)"""
+        with self._log_lock:
+            if self._pending_progress:
+                pending_value, pending_status = self._pending_progress
+                progress = pending_value if progress is None else progress
+                status = pending_status if status is None else status
+            self._pending_progress = (progress, status)
+    
+    def _drain_log_queue(self):
+        """Flush queued log lines and the latest progress to the widgets, ~10 times a second"""
+        with self._log_lock:
+            batch = list(self._log_queue)
+            self._log_queue.clear()
+            pending_progress = self._pending_progress
+            self._pending_progress = None
+        
+        if batch:
+            self.log_text.insert(tk.END, ''.join(batch))
+            self.log_text.see(tk.END)
+        
+        if pending_progress:
+            progress, status = pending_progress
+            if progress is not None:
+                self.progress_var.set(progress)
+            if status is not None:
+                self.status_var.set(status)
+        
+        self.root.after(100, self._drain_log_queue)
     
     def clear_log(self):
         """Clear the log"""
@@ -495,8 +1012,7 @@ class FileOrganizerGUI:
     def update_progress(self, current, total, filename):
         """Update progress bar and status"""
         progress = (current / total) * 100
-        self.progress_var.set(progress)
-        self.status_var.set(f"Processing {current}/{total}: {filename}")
+        self.set_progress(progress, f"Processing {current}/{total}: {filename}")
         # Only log every 10th file to avoid spam
         if current % 10 == 0 or current == total:
             self.log(f"🔄 Processing: {filename} ({current}/{total})")
@@ -543,7 +1059,9 @@ class FileOrganizerGUI:
                 self.organize_by_type.get(),
                 self.add_metadata_to_filename.get(),
                 self.update_progress,
-                self.log
+                self.log,
+                metadata_categories={category for category, var in self.metadata_categories.items()
+                                     if var.get()}
             )
             
             self.log(f"✅ Processing completed!")
@@ -560,7 +1078,7 @@ class FileOrganizerGUI:
                 for error in results['errors']:
                     self.log(f"   Error: {Path(error['file_path']).name} - {error['error']}")
             
-            self.status_var.set("Processing completed successfully!")
+            self.set_progress(status="Processing completed successfully!")
             
             # Show completion dialog
             message = f"Processing completed!\n\n"
@@ -581,7 +1099,7 @@ class FileOrganizerGUI:
             self.processing = False
             self.start_button.config(state='normal')
             self.stop_button.config(state='disabled')
-            self.progress_var.set(0)
+            self.set_progress(0)
     
     def stop_processing(self):
         """Stop the processing"""
@@ -604,10 +1122,9 @@ def main():
     
     missing_packages = []
     
+    # find_spec only locates the packages - they are imported later, when first needed
     for package_name, import_name in required_packages.items():
-        try:
-            __import__(import_name)
-        except ImportError:
+        if importlib.util.find_spec(import_name) is None:
             missing_packages.append(package_name)
     
     if missing_packages:
@@ -630,6 +1147,8 @@ def main():
         root.mainloop()
     except Exception as e:
         print(f"Application error: {str(e)}")
+    finally:
+        app.processor.close()
 
 
 if __name__ == "__main__":
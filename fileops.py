@@ -0,0 +1,229 @@
+# Helpers shared by main.py and Metadata2File.py: lazy imports, MP4 header probing and native file copies
+import os
+import sys
+import shutil
+import importlib
+import struct
+from typing import Dict, Iterator, Optional, Tuple
+
+
+# File processing libraries (PIL, PyPDF2, docx, pptx, cv2, mutagen) are heavy,
+# so they are imported on first use - see lazy_import
+_LAZY_MODULES: Dict[str, object] = {}
+
+
+def lazy_import(name: str):
+    """Import a module the first time it is needed"""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = _LAZY_MODULES[name] = importlib.import_module(name)
+        if name == 'PIL.Image':
+            # Only image headers are read, never pixel data, so the decompression bomb check is pure overhead
+            module.MAX_IMAGE_PIXELS = None
+    return module
+
+
+# Refuse to load absurdly large moov atoms into memory
+_MAX_MOOV_SIZE = 64 * 1024 * 1024
+
+
+def _iter_boxes(data: bytes, start: int, end: int) -> Iterator[Tuple[bytes, int, int]]:
+    """Yield (type, payload_start, box_end) for each ISO BMFF box in data[start:end]"""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack_from('>I4s', data, pos)
+        header_size = 8
+        if size == 1:
+            if pos + 16 > end:
+                return
+            size = struct.unpack_from('>Q', data, pos + 8)[0]
+            header_size = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_size or pos + size > end:
+            return
+        yield box_type, pos + header_size, pos + size
+        pos += size
+
+
+def _find_box(data: bytes, start: int, end: int, path: Tuple[bytes, ...]) -> Optional[Tuple[int, int]]:
+    """Follow a chain of box types (e.g. mdia/minf/stbl) and return the last box's payload range"""
+    for box_type in path:
+        for found_type, payload_start, box_end in _iter_boxes(data, start, end):
+            if found_type == box_type:
+                start, end = payload_start, box_end
+                break
+        else:
+            return None
+    return start, end
+
+
+def _read_moov(file_path: str) -> Optional[bytes]:
+    """Read the moov atom, skipping over top-level boxes such as mdat without reading them"""
+    with open(file_path, 'rb') as f:
+        file_size = os.fstat(f.fileno()).st_size
+        pos = 0
+        while pos + 8 <= file_size:
+            f.seek(pos)
+            header = f.read(16)
+            size, box_type = struct.unpack_from('>I4s', header)
+            header_size = 8
+            if size == 1 and len(header) == 16:
+                size = struct.unpack_from('>Q', header, 8)[0]
+                header_size = 16
+            elif size == 0:
+                size = file_size - pos
+            if size < header_size:
+                return None
+            if box_type == b'moov':
+                if size > _MAX_MOOV_SIZE:
+                    return None
+                f.seek(pos + header_size)
+                return f.read(size - header_size)
+            pos += size
+    return None
+
+
+def probe_mp4(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, fps) of the first video track from the MP4/MOV moov atom"""
+    try:
+        moov = _read_moov(file_path)
+    except (OSError, struct.error):
+        return None
+    if not moov:
+        return None
+    
+    for box_type, trak_start, trak_end in _iter_boxes(moov, 0, len(moov)):
+        if box_type != b'trak':
+            continue
+        
+        # hdlr: version/flags, pre_defined, then the handler type
+        hdlr = _find_box(moov, trak_start, trak_end, (b'mdia', b'hdlr'))
+        if not hdlr or moov[hdlr[0] + 8:hdlr[0] + 12] != b'vide':
+            continue
+        
+        # tkhd ends with width and height as 16.16 fixed point
+        tkhd = _find_box(moov, trak_start, trak_end, (b'tkhd',))
+        mdhd = _find_box(moov, trak_start, trak_end, (b'mdia', b'mdhd'))
+        stts = _find_box(moov, trak_start, trak_end, (b'mdia', b'minf', b'stbl', b'stts'))
+        if not tkhd or not mdhd or not stts:
+            return None
+        try:
+            width, height, fps = _parse_video_trak(moov, tkhd, mdhd, stts)
+        except struct.error:
+            return None
+        if not width or not height:
+            return None
+        return width, height, fps
+    
+    return None
+
+
+def _parse_video_trak(moov: bytes, tkhd: Tuple[int, int], mdhd: Tuple[int, int],
+                      stts: Tuple[int, int]) -> Tuple[int, int, int]:
+    """Decode width/height from tkhd and the average frame rate from mdhd + stts"""
+    width, height = struct.unpack_from('>II', moov, tkhd[1] - 8)
+    width, height = width >> 16, height >> 16
+    
+    if moov[mdhd[0]] == 1:
+        timescale, duration = struct.unpack_from('>IQ', moov, mdhd[0] + 20)
+    else:
+        timescale, duration = struct.unpack_from('>II', moov, mdhd[0] + 12)
+    
+    # stts: version/flags, entry count, then (sample_count, sample_delta) pairs
+    entry_count = struct.unpack_from('>I', moov, stts[0] + 4)[0]
+    entry_count = min(entry_count, (stts[1] - stts[0] - 8) // 8)
+    frames = sum(struct.unpack_from('>I', moov, stts[0] + 8 + i * 8)[0]
+                 for i in range(entry_count))
+    
+    fps = int(round(frames * timescale / duration, 3)) if timescale and duration else 0
+    return width, height, fps
+
+
+
+# ioctl request number for FICLONE (_IOW(0x94, 9, int)) from linux/fs.h
+_FICLONE = 0x40049409
+
+
+def _copy_linux(src: str, dst: str):
+    """Reflink the file on copy-on-write filesystems, otherwise transfer it inside the kernel"""
+    import fcntl
+    
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            # Btrfs/XFS share the extents instantly; other filesystems reject the ioctl
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            return
+        except OSError:
+            pass
+        
+        offset = 0
+        try:
+            # copy_file_range lets the filesystem copy server-side (NFS, SMB) or reflink on its own
+            while True:
+                copied = os.copy_file_range(src_fd, dst_fd, 1 << 30, offset)
+                if copied == 0:
+                    return
+                offset += copied
+        except (OSError, AttributeError):
+            # Older kernels, cross-filesystem copies before 5.3, or Python without the call -
+            # sendfile carries on from wherever copy_file_range stopped
+            pass
+        
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, 1 << 30)
+            if sent == 0:
+                break
+            offset += sent
+
+
+def _copy_windows(src: str, dst: str):
+    """Let the OS copy the file (data and metadata) with CopyFileExW"""
+    import ctypes
+    
+    if not ctypes.windll.kernel32.CopyFileExW(src, dst, None, None, None, 0):
+        raise ctypes.WinError()
+
+
+def _copy_macos(src: str, dst: str):
+    """Clone the file with clonefile (instant copy-on-write on APFS)"""
+    import ctypes
+    
+    libc = ctypes.CDLL(None, use_errno=True)
+    # clonefile refuses to overwrite, and callers may already hold dst as an empty placeholder,
+    # so clone to a temporary name and move it over dst
+    tmp_path = f"{dst}.clone"
+    if libc.clonefile(os.fsencode(src), os.fsencode(tmp_path), 0) != 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), src)
+    os.replace(tmp_path, dst)
+
+
+def fast_copy(src: str, dst: str, use_links: bool = False):
+    """Copy a file with the fastest native mechanism, falling back to shutil.copy2"""
+    if use_links:
+        # A hard link shares the source's data and metadata, so there is nothing left to copy
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    
+    try:
+        if sys.platform.startswith('linux'):
+            _copy_linux(src, dst)
+        elif sys.platform == 'win32':
+            _copy_windows(src, dst)
+        elif sys.platform == 'darwin':
+            _copy_macos(src, dst)
+        else:
+            shutil.copy2(src, dst)
+            return
+    except (OSError, AttributeError):
+        shutil.copy2(src, dst)
+        return
+    
+    # Preserve timestamps and permissions the same way copy2 does
+    shutil.copystat(src, dst)
+
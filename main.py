@@ -1,11 +1,23 @@
 import os
 import sys
-import shutil
+import functools
+import importlib
+import importlib.util
 import logging
-from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+import logging.handlers
+import mmap
+import queue
+import struct
+import re
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 import threading
 import time
+import zipfile
+import zlib
+import xml.etree.ElementTree as ET
 from datetime import datetime
 
 # GUI imports
@@ -13,18 +25,497 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from tkinter.scrolledtext import ScrolledText
 
-# File processing imports
-from PIL import Image
-from PIL.ExifTags import TAGS
-import PyPDF2
-import docx
-from pptx import Presentation
-import cv2
-import mutagen
-from mutagen.mp3 import MP3
-from mutagen.mp4 import MP4
-from mutagen.flac import FLAC
-from mutagen.oggvorbis import OggVorbis
+# Helpers shared with Metadata2File.py
+from fileops import fast_copy, lazy_import, probe_mp4
+
+# File processing libraries (PIL, PyPDF2, docx, pptx, cv2, mutagen) are heavy, so they are
+# imported on first use - a run without videos never loads cv2
+# (pip package, import name) for every library the extractors load through lazy_import
+_REQUIRED_PACKAGES = (
+    ('Pillow', 'PIL'),
+    ('PyPDF2', 'PyPDF2'),
+    ('python-docx', 'docx'),
+    ('python-pptx', 'pptx'),
+    ('opencv-python', 'cv2'),
+    ('mutagen', 'mutagen'),
+)
+
+
+# File signatures (magic bytes) - earlier entries win when several match
+_SIGNATURES = {
+    b'\xFF\xD8\xFF': ('Images', 'jpeg'),
+    b'\x89PNG\r\n\x1a\n': ('Images', 'png'),
+    b'GIF87a': ('Images', 'gif'),
+    b'GIF89a': ('Images', 'gif'),
+    b'BM': ('Images', 'bmp'),
+    b'RIFF': ('Videos', 'webp'),  # Could also be WAV
+    b'\x00\x00\x00\x18ftypmp4': ('Videos', 'mp4'),
+    b'\x00\x00\x00\x20ftypM4V': ('Videos', 'mp4'),
+    b'%PDF': ('Documents', 'pdf'),
+    b'PK\x03\x04': ('Documents', 'office'),  # ZIP-based (docx, pptx) - only used when the extension is unknown
+    b'ID3': ('Audio', 'mp3'),
+    b'\xFF\xFB': ('Audio', 'mp3'),
+    b'\xFF\xF3': ('Audio', 'mp3'),
+    b'fLaC': ('Audio', 'flac'),
+    b'OggS': ('Audio', 'ogg'),
+    b'PK': ('Archives', 'zip'),
+    b'Rar!': ('Archives', 'rar'),
+    b'7z\xBC\xAF\'27\x1C': ('Archives', '7z'),
+    b'MZ': ('Executables', 'exe'),
+}
+
+# Signatures grouped by their first byte, so a header is only compared against its own bucket
+_SIG_INDEX: Dict[int, List[Tuple[bytes, str, str]]] = {}
+for _sig, (_category, _format_type) in _SIGNATURES.items():
+    _SIG_INDEX.setdefault(_sig[0], []).append((_sig, _category, _format_type))
+
+# (category, format_type) by _SIGNATURES position, for the numba scanner's results
+_SIGNATURE_MATCHES = list(_SIGNATURES.values())
+
+# Runs with at least this many files use the numba signature scanner, when numba is installed
+_NUMBA_MIN_FILES = 10000
+
+# Runs at least this large extract metadata in worker processes unless told otherwise -
+# below it, starting the processes costs more than running PIL/cv2 under the GIL saves
+_PROCESS_METADATA_MIN_FILES = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_scanner():
+    """Build the JIT-compiled signature scanner - returns header -> index into _SIGNATURES, or None without numba"""
+    try:
+        import numba
+        import numpy as np
+    except ImportError:
+        return None
+    
+    # Signatures as right-padded rows plus their real lengths, in _SIGNATURES order
+    sigs = np.zeros((len(_SIGNATURES), 16), dtype=np.uint8)
+    lengths = np.array([len(sig) for sig in _SIGNATURES], dtype=np.int32)
+    for row, sig in enumerate(_SIGNATURES):
+        sigs[row, :len(sig)] = np.frombuffer(sig, dtype=np.uint8)
+    
+    @numba.njit
+    def scan(header, sigs, lengths):
+        for i in range(sigs.shape[0]):
+            if lengths[i] > header.shape[0]:
+                continue
+            matched = True
+            for j in range(lengths[i]):
+                if header[j] != sigs[i, j]:
+                    matched = False
+                    break
+            if matched:
+                return i
+        return -1
+    
+    try:
+        # Compile now, so a numba problem means "no scanner" rather than failed detections
+        scan(np.zeros(32, dtype=np.uint8), sigs, lengths)
+    except Exception:
+        return None
+    
+    return lambda header: scan(np.frombuffer(header, dtype=np.uint8), sigs, lengths)
+
+
+# ISO BMFF brands, read from the ftyp box at bytes 8-12 (after the 4-byte size and b'ftyp')
+_FTYP_BRANDS = {
+    b'heic': ('Images', 'heic'),
+    b'heix': ('Images', 'heic'),  # HEIC variant
+    b'mif1': ('Images', 'heic'),  # HEIC variant
+    b'msf1': ('Images', 'heic'),  # HEIC variant
+}
+
+
+class DetectionResult(NamedTuple):
+    """Everything detect_file_type learned about a file"""
+    category: str
+    format_type: str
+    method: str
+    size: int
+    header: bytes
+
+
+# Page-tree nodes and their page counts inside raw PDF bytes
+_PDF_PAGES = re.compile(rb'/Type\s*/Pages\b')
+_PDF_COUNT = re.compile(rb'/Count\s+(\d+)')
+
+
+def _pdf_page_count(file_path: str, mapped: Optional[mmap.mmap] = None) -> Optional[int]:
+    """Page count from the root page-tree node's /Count, or None if it can't be found in the raw bytes"""
+    count = None
+    if mapped is not None:
+        context = nullcontext(mapped)
+    else:
+        f = open(file_path, 'rb')
+        context = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        f.close()  # the mapping stays valid after the file is closed
+    with context as mm:
+        for match in _PDF_PAGES.finditer(mm):
+            start = mm.rfind(b'obj', 0, match.start())
+            end = mm.find(b'endobj', match.end())
+            if start < 0 or end < 0:
+                continue
+            obj = mm[start:end]
+            # The root node is the one without a parent; the last one wins for incrementally updated files
+            if b'/Parent' not in obj:
+                found = _PDF_COUNT.search(obj)
+                if found:
+                    count = int(found.group(1))
+    return count
+
+
+# Paragraph tag in word/document.xml and slide parts inside a .pptx
+_DOCX_PARAGRAPH = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p'
+_PPTX_SLIDE = re.compile(r'ppt/slides/slide\d+\.xml$')
+_PPTX_SLIDE_BYTES = re.compile(rb'ppt/slides/slide\d+\.xml$')
+
+# End-of-central-directory record: 22 bytes plus a comment of up to 64 KiB
+_ZIP_EOCD_SEARCH = 22 + 0xFFFF
+
+
+def _zip_entries(data) -> Optional[Dict[bytes, Tuple[int, int, int]]]:
+    """Read a mapped ZIP's central directory: name -> (method, compressed_size, local_header_offset)"""
+    # None means the archive needs zipfile's handling (ZIP64, prepended data, damage)
+    eocd = data.rfind(b'PK\x05\x06', max(0, len(data) - _ZIP_EOCD_SEARCH))
+    if eocd < 0 or eocd + 22 > len(data):
+        return None
+    total, _, cd_offset = struct.unpack_from('<HII', data, eocd + 10)
+    if cd_offset == 0xFFFFFFFF:
+        return None
+    
+    entries = {}
+    pos = cd_offset
+    for _ in range(total):
+        if data[pos:pos + 4] != b'PK\x01\x02':
+            return None
+        method, = struct.unpack_from('<H', data, pos + 10)
+        compressed_size, = struct.unpack_from('<I', data, pos + 20)
+        name_len, extra_len, comment_len = struct.unpack_from('<HHH', data, pos + 28)
+        offset, = struct.unpack_from('<I', data, pos + 42)
+        entries[data[pos + 46:pos + 46 + name_len]] = (method, compressed_size, offset)
+        pos += 46 + name_len + extra_len + comment_len
+    return entries
+
+
+def _zip_member_chunks(data, entry: Tuple[int, int, int]) -> Iterator[bytes]:
+    """Yield the uncompressed content of one member of a mapped ZIP in 64 KiB steps"""
+    method, compressed_size, offset = entry
+    if data[offset:offset + 4] != b'PK\x03\x04' or compressed_size == 0xFFFFFFFF:
+        raise zipfile.BadZipFile("unexpected local header")
+    name_len, extra_len = struct.unpack_from('<HH', data, offset + 26)
+    start = offset + 30 + name_len + extra_len
+    end = start + compressed_size
+    
+    if method == zipfile.ZIP_STORED:
+        for pos in range(start, end, 1 << 16):
+            yield data[pos:min(pos + (1 << 16), end)]
+    elif method == zipfile.ZIP_DEFLATED:
+        inflater = zlib.decompressobj(-15)
+        for pos in range(start, end, 1 << 16):
+            yield inflater.decompress(data[pos:min(pos + (1 << 16), end)])
+        yield inflater.flush()
+    else:
+        raise zipfile.BadZipFile(f"unsupported compression method {method}")
+
+
+def _count_body_paragraphs(chunks: Iterator[bytes]) -> int:
+    """Count paragraphs directly under <w:body> while streaming document.xml"""
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    count = depth = 0
+    
+    def consume():
+        nonlocal count, depth
+        for event, elem in parser.read_events():
+            if event == 'start':
+                depth += 1
+                continue
+            depth -= 1
+            # document > body > p - same paragraphs python-docx reports
+            if depth == 2:
+                if elem.tag == _DOCX_PARAGRAPH:
+                    count += 1
+                elem.clear()
+    
+    for chunk in chunks:
+        parser.feed(chunk)
+        consume()
+    parser.close()
+    consume()
+    return count
+
+
+def _docx_paragraph_count(file_path: str, mapped: Optional[mmap.mmap] = None) -> int:
+    """Body paragraphs of a .docx, streamed from word/document.xml without building the document"""
+    entries = _zip_entries(mapped) if mapped is not None else None
+    if entries is not None:
+        entry = entries.get(b'word/document.xml')
+        if entry is None:
+            raise KeyError('word/document.xml')
+        return _count_body_paragraphs(_zip_member_chunks(mapped, entry))
+    
+    with zipfile.ZipFile(file_path) as zf, zf.open('word/document.xml') as f:
+        return _count_body_paragraphs(iter(lambda: f.read(1 << 16), b''))
+
+
+def _pptx_slide_count(file_path: str, mapped: Optional[mmap.mmap] = None) -> int:
+    """Slides of a .pptx, counted from the ZIP central directory without parsing any XML"""
+    entries = _zip_entries(mapped) if mapped is not None else None
+    if entries is not None:
+        return sum(1 for name in entries if _PPTX_SLIDE_BYTES.match(name))
+    
+    with zipfile.ZipFile(file_path) as zf:
+        return sum(1 for name in zf.namelist() if _PPTX_SLIDE.match(name))
+
+
+# EBML element IDs needed to find the video track of a Matroska/WebM file
+_EBML_SEGMENT = 0x18538067
+_EBML_TRACKS = 0x1654AE6B
+_EBML_CLUSTER = 0x1F43B675
+_EBML_TRACK_ENTRY = 0xAE
+_EBML_TRACK_TYPE = 0x83
+_EBML_DEFAULT_DURATION = 0x23E383
+_EBML_VIDEO = 0xE0
+_EBML_PIXEL_WIDTH = 0xB0
+_EBML_PIXEL_HEIGHT = 0xBA
+
+# Tracks sit before the first Cluster, normally well inside the first megabyte
+_MKV_PROBE_BYTES = 1 << 20
+
+
+def _read_vint(data: bytes, pos: int, keep_marker: bool) -> Tuple[Optional[int], int]:
+    """Decode an EBML variable-length integer - returns (value, next_pos); value is None for 'unknown size'"""
+    length = 9 - data[pos].bit_length()
+    if length > 8:
+        raise ValueError("invalid EBML length")
+    value = int.from_bytes(data[pos:pos + length], 'big')
+    if keep_marker:
+        return value, pos + length
+    value &= (1 << (7 * length)) - 1
+    if value == (1 << (7 * length)) - 1:
+        return None, pos + length
+    return value, pos + length
+
+
+def _iter_ebml(data: bytes, start: int, end: int) -> Iterator[Tuple[int, int, int]]:
+    """Yield (element_id, payload_start, payload_end) for each EBML element in data[start:end]"""
+    pos = start
+    while pos < end:
+        element_id, pos = _read_vint(data, pos, keep_marker=True)
+        size, pos = _read_vint(data, pos, keep_marker=False)
+        # Unknown-size (live) elements and elements cut off by the probe run to the end of what we have
+        payload_end = end if size is None else min(pos + size, end)
+        yield element_id, pos, payload_end
+        pos = payload_end
+
+
+def _probe_mkv(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, fps) of the first video track from the Matroska/WebM Tracks element"""
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read(_MKV_PROBE_BYTES)
+        for element_id, start, end in _iter_ebml(data, 0, len(data)):
+            if element_id != _EBML_SEGMENT:
+                continue
+            for child_id, child_start, child_end in _iter_ebml(data, start, end):
+                if child_id == _EBML_TRACKS:
+                    return _parse_mkv_tracks(data, child_start, child_end)
+                if child_id == _EBML_CLUSTER:
+                    return None
+    except (OSError, IndexError, ValueError):
+        return None
+    return None
+
+
+def _parse_mkv_tracks(data: bytes, start: int, end: int) -> Optional[Tuple[int, int, int]]:
+    """Find the first video TrackEntry and decode its pixel size and DefaultDuration"""
+    for entry_id, entry_start, entry_end in _iter_ebml(data, start, end):
+        if entry_id != _EBML_TRACK_ENTRY:
+            continue
+        track_type = width = height = frame_duration = None
+        for field_id, field_start, field_end in _iter_ebml(data, entry_start, entry_end):
+            value = data[field_start:field_end]
+            if field_id == _EBML_TRACK_TYPE:
+                track_type = int.from_bytes(value, 'big')
+            elif field_id == _EBML_DEFAULT_DURATION:
+                frame_duration = int.from_bytes(value, 'big')
+            elif field_id == _EBML_VIDEO:
+                for video_id, video_start, video_end in _iter_ebml(data, field_start, field_end):
+                    if video_id == _EBML_PIXEL_WIDTH:
+                        width = int.from_bytes(data[video_start:video_end], 'big')
+                    elif video_id == _EBML_PIXEL_HEIGHT:
+                        height = int.from_bytes(data[video_start:video_end], 'big')
+        # Track type 1 is video; without a DefaultDuration the frame rate needs the demuxer
+        if track_type == 1:
+            if not width or not height or not frame_duration:
+                return None
+            return width, height, int(round(1e9 / frame_duration, 3))
+    return None
+
+
+def _probe_avi(file_path: str) -> Optional[Tuple[int, int, int]]:
+    """Read (width, height, fps) from the AVI main header (avih), which starts at byte 32"""
+    try:
+        with open(file_path, 'rb') as f:
+            header = f.read(72)
+        if len(header) < 72 or header[0:4] != b'RIFF' or header[8:12] != b'AVI ' or header[24:28] != b'avih':
+            return None
+        # MainAVIHeader: microseconds per frame first, frame width and height at offsets 32 and 36
+        micro_sec_per_frame = struct.unpack_from('<I', header, 32)[0]
+        width, height = struct.unpack_from('<II', header, 64)
+    except (OSError, struct.error):
+        return None
+    if not width or not height:
+        return None
+    fps = int(round(1e6 / micro_sec_per_frame, 3)) if micro_sec_per_frame else 0
+    return width, height, fps
+
+
+# Container parsers by extension; anything else (or anything they can't read) goes to OpenCV
+_VIDEO_PROBES = {
+    '.mp4': probe_mp4,
+    '.mov': probe_mp4,
+    '.m4v': probe_mp4,
+    '.mkv': _probe_mkv,
+    '.webm': _probe_mkv,
+    '.avi': _probe_avi,
+}
+
+
+def _image_info(file_path: str, mapped: Optional[mmap.mmap] = None) -> str:
+    """Image size and format, read from the file's mapping when there is one"""
+    if mapped is not None:
+        mapped.seek(0)
+    with lazy_import('PIL.Image').open(mapped if mapped is not None else file_path) as img:
+        return f"{img.size[0]}x{img.size[1]}_{img.format}"
+
+
+def _video_info(file_path: str) -> str:
+    """Video frame size and frame rate"""
+    # Container headers give size and frame rate without initialising any codec
+    probe = _VIDEO_PROBES.get(os.path.splitext(file_path)[1].lower())
+    probed = probe(file_path) if probe else None
+    if probed is not None:
+        width, height, fps = probed
+        return f"{width}x{height}_{fps}fps"
+    
+    cv2 = lazy_import('cv2')
+    cap = cv2.VideoCapture(file_path)
+    if cap.isOpened():
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        fps = int(cap.get(cv2.CAP_PROP_FPS))
+        cap.release()
+        return f"{width}x{height}_{fps}fps"
+    return "unknown"
+
+
+def _audio_info(file_path: str) -> str:
+    """Audio duration and bitrate"""
+    audio_file = lazy_import('mutagen').File(file_path)
+    if audio_file and hasattr(audio_file, 'info'):
+        duration = int(audio_file.info.length)
+        bitrate = getattr(audio_file.info, 'bitrate', 0)
+        return f"{duration}s_{bitrate}kbps"
+    return "unknown"
+
+
+def _pdf_info(file_path: str, mapped: Optional[mmap.mmap]) -> str:
+    """Page count of a PDF"""
+    pages = _pdf_page_count(file_path, mapped)
+    if pages is None:
+        # Page tree is compressed or unusual - let PyPDF2 parse it
+        with open(file_path, 'rb') as f:
+            reader = lazy_import('PyPDF2').PdfReader(f)
+            pages = len(reader.pages)
+    return f"{pages}pages"
+
+
+def _word_info(file_path: str, mapped: Optional[mmap.mmap]) -> str:
+    """Paragraph count of a Word document"""
+    try:
+        paragraphs = _docx_paragraph_count(file_path, mapped)
+    except (zipfile.BadZipFile, KeyError):
+        doc = lazy_import('docx').Document(file_path)
+        paragraphs = len(doc.paragraphs)
+    return f"{paragraphs}paragraphs"
+
+
+def _presentation_info(file_path: str, mapped: Optional[mmap.mmap]) -> str:
+    """Slide count of a presentation"""
+    try:
+        slides = _pptx_slide_count(file_path, mapped)
+    except zipfile.BadZipFile:
+        prs = lazy_import('pptx').Presentation(file_path)
+        slides = len(prs.slides)
+    return f"{slides}slides"
+
+
+def _text_info(file_path: str, mapped: Optional[mmap.mmap]) -> str:
+    """Line count of a text file"""
+    # Count newlines in raw 1 MiB chunks instead of decoding every line
+    lines = 0
+    last_chunk = b''
+    with nullcontext(mapped) if mapped is not None else open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            lines += chunk.count(b'\n')
+            last_chunk = chunk
+    # A final line without a trailing newline still counts
+    if last_chunk and not last_chunk.endswith(b'\n'):
+        lines += 1
+    return f"{lines}lines"
+
+
+# Document extractors by extension; other document types just get "document"
+_DOC_HANDLERS = {
+    '.pdf': _pdf_info,
+    '.docx': _word_info,
+    '.doc': _word_info,
+    '.pptx': _presentation_info,
+    '.ppt': _presentation_info,
+    '.txt': _text_info,
+}
+
+
+def _document_info(file_path: str, mapped: Optional[mmap.mmap] = None) -> str:
+    """Page, paragraph, slide or line count, depending on the document type"""
+    handler = _DOC_HANDLERS.get(os.path.splitext(file_path)[1].lower())
+    if handler is None:
+        return "document"
+    if mapped is not None:
+        mapped.seek(0)
+    return handler(file_path, mapped)
+
+
+# Metadata extractors by category as (label for log messages, extractor, value when nothing was found)
+# They are plain module-level functions so worker processes can run them
+_INFO_EXTRACTORS = {
+    'Images': ('image', _image_info, "unknown"),
+    'Videos': ('video', _video_info, "unknown"),
+    'Audio': ('audio', _audio_info, "unknown"),
+    'Documents': ('document', _document_info, "document"),
+}
+
+
+# Categories whose extractors can read from the mapping detect_file_type made, and how many mappings to hold
+_MAPPED_CATEGORIES = ('Images', 'Documents')
+_MAX_MAPPINGS = 256
+
+# Only mappings up to this size are read ahead whole - for bigger files the extractors touch just a few pages
+_WILLNEED_MAX_BYTES = 8 * 1024 * 1024
+
+
+def _extract_info(task: Tuple[str, str], mapped: Optional[mmap.mmap] = None) -> Tuple[str, Optional[str]]:
+    """Run the extractor for (category, file_path) - returns (info, error_or_None)"""
+    category, file_path = task
+    _, extract, fallback = _INFO_EXTRACTORS[category]
+    try:
+        if mapped is not None:
+            return extract(file_path, mapped), None
+        return extract(file_path), None
+    except Exception as e:
+        return fallback, str(e)
+
 
 class FileLogger:
     """Dedicated logger for file type detection and processing"""
@@ -46,10 +537,12 @@ class FileLogger:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         # Main log file for all operations
-        self.main_log_file = os.path.join(self.log_directory, f"file_organizer_{timestamp}.log")
+        self.main_log_name = f"file_organizer_{timestamp}.log"
+        self.main_log_file = os.path.join(self.log_directory, self.main_log_name)
         
         # Specific log file for file type detection
-        self.detection_log_file = os.path.join(self.log_directory, f"file_detection_{timestamp}.log")
+        self.detection_log_name = f"file_detection_{timestamp}.log"
+        self.detection_log_file = os.path.join(self.log_directory, self.detection_log_name)
         
         # Setup main logger
         self.main_logger = logging.getLogger('FileOrganizer')
@@ -66,7 +559,7 @@ class FileLogger:
         )
         
         detection_formatter = logging.Formatter(
-            '%(asctime)s - FILE: %(filename)s - DETECTED: %(category)s/%(format_type)s - METHOD: %(method)s - SIZE: %(size)s bytes',
+            '%(asctime)s - FILE: %(file_name)s - DETECTED: %(category)s/%(format_type)s - METHOD: %(method)s - SIZE: %(size)s bytes',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         
@@ -80,75 +573,102 @@ class FileLogger:
         detection_handler.setLevel(logging.INFO)
         detection_handler.setFormatter(detection_formatter)
         
+        # Buffer records in memory and write them in bursts of up to 1024 (errors are written at once)
+        self.buffer_handlers = []
+        for handler, logger_name in ((main_handler, 'FileOrganizer'),
+                                     (detection_handler, 'FileTypeDetection')):
+            buffer_handler = logging.handlers.MemoryHandler(
+                capacity=1024, flushLevel=logging.ERROR, target=handler
+            )
+            # Both loggers share one queue, so each file only takes its own logger's records
+            buffer_handler.addFilter(logging.Filter(logger_name))
+            self.buffer_handlers.append(buffer_handler)
+        
+        # Loggers only enqueue records; a background thread formats and writes them
+        self.log_queue = queue.Queue(-1)
+        self.queue_listener = logging.handlers.QueueListener(self.log_queue, *self.buffer_handlers)
+        self.queue_listener.start()
+        
         # Add handlers to loggers
-        self.main_logger.addHandler(main_handler)
-        self.detection_logger.addHandler(detection_handler)
+        queue_handler = logging.handlers.QueueHandler(self.log_queue)
+        self.main_logger.addHandler(queue_handler)
+        self.detection_logger.addHandler(queue_handler)
         
         # Prevent duplicate logs
         self.main_logger.propagate = False
         self.detection_logger.propagate = False
     
-    def log_main(self, level: str, message: str):
-        """Log main application events"""
-        if level.upper() == 'INFO':
-            self.main_logger.info(message)
-        elif level.upper() == 'WARNING':
-            self.main_logger.warning(message)
-        elif level.upper() == 'ERROR':
-            self.main_logger.error(message)
-        elif level.upper() == 'DEBUG':
-            self.main_logger.debug(message)
-    
     def log_file_detection(self, filename: str, file_path: str, category: str, 
                           format_type: str, detection_method: str, file_size: int):
         """Log file type detection details"""
-        # Create a custom log record with additional fields
-        record = logging.LogRecord(
-            name='FileTypeDetection',
-            level=logging.INFO,
-            pathname=file_path,
-            lineno=0,
-            msg='',
-            args=(),
-            exc_info=None
-        )
-        
-        # Add custom attributes
-        record.filename = filename
-        record.category = category
-        record.format_type = format_type
-        record.method = detection_method
-        record.size = file_size
-        
-        # Log the record
-        for handler in self.detection_logger.handlers:
-            handler.emit(record)
+        self.detection_logger.info('', extra={
+            'file_name': filename,
+            'category': category,
+            'format_type': format_type,
+            'method': detection_method,
+            'size': file_size,
+        })
+    
+    def flush(self):
+        """Write out every record logged so far"""
+        # Wait for the listener to hand all queued records to the buffers, then empty the buffers
+        self.log_queue.join()
+        for handler in self.buffer_handlers:
+            handler.flush()
+    
+    def close(self):
+        """Stop the background writer and close the log files"""
+        self.queue_listener.stop()
+        for handler in self.buffer_handlers:
+            # MemoryHandler.close() flushes and then drops its target, so keep hold of the file handler
+            target = handler.target
+            handler.close()
+            target.close()
     
     def create_summary_log(self, results: Dict):
         """Create a summary log file"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        summary_file = os.path.join(self.log_directory, f"processing_summary_{timestamp}.log")
+        now = datetime.now()
+        summary_file = os.path.join(self.log_directory, f"processing_summary_{now:%Y%m%d_%H%M%S}.log")
         
         with open(summary_file, 'w', encoding='utf-8') as f:
             f.write("FILE ORGANIZER PROCESSING SUMMARY\n")
             f.write("=" * 50 + "\n\n")
-            f.write(f"Processing completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            f.write(f"Processing completed at: {now:%Y-%m-%d %H:%M:%S}\n\n")
             
             f.write(f"STATISTICS:\n")
             f.write(f"Total files found: {results['total_files']}\n")
             f.write(f"Successfully processed: {results['processed_files']}\n")
-            f.write(f"Errors encountered: {len(results['errors'])}\n\n")
+            f.write(f"Errors encountered: {results['error_count']}\n\n")
             
             f.write("FILES BY CATEGORY:\n")
-            for category, count in results['categories'].items():
+            for category, count in results['categories'].most_common():
                 f.write(f"  {category}: {count} files\n")
             
             if results['errors']:
                 f.write(f"\nERRORS:\n")
+                if results['error_count'] > len(results['errors']):
+                    f.write(f"  (last {len(results['errors'])} shown - the main log lists every error)\n\n")
                 for error in results['errors']:
                     f.write(f"  File: {error['file_path']}\n")
-                    f.write(f"  Error: {error['error']}\n")
-                    f.write(f"  Time: {error['timestamp']}\n\n")
+                    f.write(f"  Error: {error['error']}\n\n")
+
+
+# Errors listed in the GUI after a run - the main log has every one
+_MAX_SHOWN_ERRORS = 50
+
+# Main window size - known up front, so centring needs no geometry pass
+_WINDOW_WIDTH = 950
+_WINDOW_HEIGHT = 800
+
+# Lines kept in the GUI log widget - older ones are dropped, the log files keep everything
+_LOG_WIDGET_MAX_LINES = 5000
+
+# Errors kept in the results (the main log records all of them) and files per batch callback
+_MAX_KEPT_ERRORS = 1000
+_BATCH_SIZE = 1000
+
+# Per-file work blocks on disk far more than on the GIL, so run well over one thread per core
+_DEFAULT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 class FileProcessor:
@@ -163,195 +683,199 @@ class FileProcessor:
         'Executables': ['.exe', '.msi', '.dmg', '.deb', '.rpm']
     }
     
+    # Flat extension -> category index for the extension fallback
+    _EXT_TO_CATEGORY = {ext: category
+                        for category, extensions in SUPPORTED_FORMATS.items()
+                        for ext in extensions}
+    
     def __init__(self, logger: FileLogger = None):
         self.processed_files = []
         self.errors = []
         self.file_stats = {}
         self.logger = logger
+        
+        # JIT signature scanner, switched on per run for large inputs
+        self._scanner = None
+        
+        # Metadata extractor for each category that has one
+        self._category_info = {
+            'Images': self.get_image_info,
+            'Videos': self.get_video_info,
+            'Audio': self.get_audio_info,
+            'Documents': self.get_document_info,
+        }
+        
+        # Detection results by path, so later steps don't detect the same file again
+        self._detect_cache: Dict[str, DetectionResult] = {}
+        
+        # stat results taken from the folder scan, so detection doesn't stat files again
+        self._stat_cache: Dict[str, os.stat_result] = {}
+        
+        # Read-only mappings made during detection, reused by the image/document extractors
+        self._mmap_cache: "OrderedDict[str, mmap.mmap]" = OrderedDict()
+        self._mmap_lock = threading.Lock()
+        
+        # Per-destination-folder locks for duplicate-name handling across worker threads
+        self._folder_locks: Dict[str, threading.Lock] = {}
+        self._folder_locks_guard = threading.Lock()
+        
+        # Names already present in (or claimed for) each destination folder during a run
+        self._dir_contents: Dict[str, set] = {}
+        
+        # Next duplicate suffix to try for each (folder, name) - repeated names don't rescan _1, _2, ...
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
     
-    def detect_file_type(self, file_path: str) -> Tuple[str, str, str]:
+    def detect_file_type(self, file_path: str, keep_mapping: bool = False) -> Tuple[str, str, str]:
         """Detect file type by reading file signature/magic bytes"""
         filename = os.path.basename(file_path)
         file_size = 0
-        detection_method = "unknown"
+        header = b''
+        fd = None
         
         try:
-            file_size = os.path.getsize(file_path)
+            # One open serves the size, the header and (with keep_mapping) a mapping the metadata step can reuse
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            st = self._stat_cache.get(file_path)
+            file_size = (st or os.fstat(fd)).st_size
+            header = os.read(fd, 32)
             
-            with open(file_path, 'rb') as f:
-                header = f.read(32)
+            # Check file signatures first - only those sharing the header's first byte can match
+            match = None
+            if self._scanner is not None:
+                index = self._scanner(header)
+                if index >= 0:
+                    match = _SIGNATURE_MATCHES[index]
+            elif header:
+                for sig, category, format_type in _SIG_INDEX.get(header[0], ()):
+                    if header.startswith(sig):
+                        match = category, format_type
+                        break
             
-            # File signatures (magic bytes)
-            signatures = {
-                b'\xFF\xD8\xFF': ('Images', 'jpeg'),
-                b'\x89PNG\r\n\x1a\n': ('Images', 'png'),
-                b'GIF87a': ('Images', 'gif'),
-                b'GIF89a': ('Images', 'gif'),
-                b'BM': ('Images', 'bmp'),
-                b'ftypheic': ('Images', 'heic'),  # HEIC magic bytes
-                b'ftypheix': ('Images', 'heic'),  # HEIC variant
-                b'ftypmif1': ('Images', 'heic'),  # HEIC variant
-                b'ftypmsf1': ('Images', 'heic'),  # HEIC variant
-                b'RIFF': ('Videos', 'webp'),  # Could also be WAV
-                b'\x00\x00\x00\x18ftypmp4': ('Videos', 'mp4'),
-                b'\x00\x00\x00\x20ftypM4V': ('Videos', 'mp4'),
-                b'%PDF': ('Documents', 'pdf'),
-                b'PK\x03\x04': ('Documents', 'office'),  # ZIP-based (docx, pptx)
-                b'ID3': ('Audio', 'mp3'),
-                b'\xFF\xFB': ('Audio', 'mp3'),
-                b'\xFF\xF3': ('Audio', 'mp3'),
-                b'fLaC': ('Audio', 'flac'),
-                b'OggS': ('Audio', 'ogg'),
-                b'PK': ('Archives', 'zip'),
-                b'Rar!': ('Archives', 'rar'),
-                b'7z\xBC\xAF\'27\x1C': ('Archives', '7z'),
-                b'MZ': ('Executables', 'exe'),
-            }
+            # ISO BMFF containers carry their brand after the box size and 'ftyp'
+            if match is None and header[4:8] == b'ftyp':
+                match = _FTYP_BRANDS.get(header[8:12])
             
-            # Check file signatures first
-            for sig, (category, format_type) in signatures.items():
-                if header.startswith(sig):
-                    detection_method = "magic_bytes"
-                    if self.logger:
-                        self.logger.log_file_detection(
-                            filename, file_path, category, format_type, 
-                            detection_method, file_size
-                        )
-                    return category, format_type, detection_method
+            # ZIP and Office files share the PK header - a known extension tells them apart,
+            # the same way the extension fast path in _process_one does
+            ext = os.path.splitext(filename)[1].lower()
+            if match and header.startswith(b'PK') and ext in self._EXT_TO_CATEGORY:
+                match = None
             
-            # Check by file extension as fallback
-            ext = Path(file_path).suffix.lower()
-            for category, extensions in self.SUPPORTED_FORMATS.items():
-                if ext in extensions:
+            if match:
+                category, format_type = match
+                detection_method = "magic_bytes"
+            else:
+                # Check by file extension as fallback
+                category = self._EXT_TO_CATEGORY.get(ext)
+                if category:
                     detection_method = "file_extension"
                     format_type = ext[1:]  # Remove the dot
-                    if self.logger:
-                        self.logger.log_file_detection(
-                            filename, file_path, category, format_type, 
-                            detection_method, file_size
-                        )
-                    return category, format_type, detection_method
+                else:
+                    # Unknown file type
+                    category, format_type, detection_method = 'Other', 'unknown', "unknown"
             
-            # Unknown file type
-            detection_method = "unknown"
-            if self.logger:
-                self.logger.log_file_detection(
-                    filename, file_path, 'Other', 'unknown', 
-                    detection_method, file_size
-                )
-            return 'Other', 'unknown', detection_method
+            # Map only files whose metadata is about to be read by an extractor that can use it
+            if keep_mapping and file_size and category in _MAPPED_CATEGORIES:
+                try:
+                    self._keep_mapping(file_path, mmap.mmap(fd, 0, access=mmap.ACCESS_READ))
+                except (OSError, ValueError):
+                    # Not mappable (e.g. some network or special files) - the extractor opens the path
+                    pass
             
         except Exception as e:
-            detection_method = "error"
+            category, format_type, detection_method = 'Error', str(e), "error"
             if self.logger:
-                self.logger.log_main('ERROR', f"Error detecting file type for {filename}: {str(e)}")
-                self.logger.log_file_detection(
-                    filename, file_path, 'Error', str(e), 
-                    detection_method, file_size
-                )
-            return 'Error', str(e), detection_method
+                self.logger.main_logger.error("Error detecting file type for %s: %s", filename, e)
+        finally:
+            if fd is not None:
+                os.close(fd)
+        
+        if self.logger:
+            self.logger.log_file_detection(
+                filename, file_path, category, format_type, 
+                detection_method, file_size
+            )
+        
+        self._detect_cache[file_path] = DetectionResult(category, format_type, detection_method,
+                                                        file_size, header)
+        return category, format_type, detection_method
+    
+    def _keep_mapping(self, file_path: str, mapped: mmap.mmap):
+        """Hold a file's mapping for the metadata step, closing the oldest ones past _MAX_MAPPINGS"""
+        if hasattr(mmap, 'MADV_WILLNEED') and len(mapped) <= _WILLNEED_MAX_BYTES:
+            # Start pulling the rest of the file into the page cache while other work runs
+            mapped.madvise(mmap.MADV_WILLNEED)
+        with self._mmap_lock:
+            self._mmap_cache[file_path] = mapped
+            while len(self._mmap_cache) > _MAX_MAPPINGS:
+                _, oldest = self._mmap_cache.popitem(last=False)
+                oldest.close()
+    
+    def _release_mapping(self, file_path: str):
+        """Close the mapping held for file_path, if any"""
+        with self._mmap_lock:
+            mapped = self._mmap_cache.pop(file_path, None)
+        if mapped is not None:
+            mapped.close()
+    
+    def detect_category_by_ext(self, file_path: str) -> Optional[str]:
+        """Category from the file extension alone, without opening the file - None if unknown"""
+        return self._EXT_TO_CATEGORY.get(os.path.splitext(file_path)[1].lower())
+    
+    def _record_info(self, category: str, file_path: str, info: str, error: Optional[str]) -> str:
+        """Log the outcome of a metadata extraction and return the info"""
+        label, _, fallback = _INFO_EXTRACTORS[category]
+        if self.logger:
+            main_logger = self.logger.main_logger
+            if error is not None:
+                main_logger.warning("Could not extract %s info for %s: %s",
+                                    label, os.path.basename(file_path), error)
+            elif info != fallback and main_logger.isEnabledFor(logging.INFO):
+                main_logger.info("%s info extracted: %s - %s",
+                                 label.capitalize(), os.path.basename(file_path), info)
+        return info
     
     def get_image_info(self, file_path: str) -> str:
         """Get basic image information"""
-        try:
-            with Image.open(file_path) as img:
-                info = f"{img.size[0]}x{img.size[1]}_{img.format}"
-                if self.logger:
-                    self.logger.log_main('INFO', f"Image info extracted: {os.path.basename(file_path)} - {info}")
-                return info
-        except Exception as e:
-            if self.logger:
-                self.logger.log_main('WARNING', f"Could not extract image info for {os.path.basename(file_path)}: {str(e)}")
-            return "unknown"
+        mapped = self._mmap_cache.get(file_path)
+        return self._record_info('Images', file_path, *_extract_info(('Images', file_path), mapped))
     
     def get_video_info(self, file_path: str) -> str:
         """Get basic video information"""
-        try:
-            cap = cv2.VideoCapture(file_path)
-            if cap.isOpened():
-                width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-                height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
-                fps = int(cap.get(cv2.CAP_PROP_FPS))
-                cap.release()
-                info = f"{width}x{height}_{fps}fps"
-                if self.logger:
-                    self.logger.log_main('INFO', f"Video info extracted: {os.path.basename(file_path)} - {info}")
-                return info
-            return "unknown"
-        except Exception as e:
-            if self.logger:
-                self.logger.log_main('WARNING', f"Could not extract video info for {os.path.basename(file_path)}: {str(e)}")
-            return "unknown"
+        return self._record_info('Videos', file_path, *_extract_info(('Videos', file_path)))
     
     def get_audio_info(self, file_path: str) -> str:
         """Get basic audio information"""
-        try:
-            audio_file = mutagen.File(file_path)
-            if audio_file and hasattr(audio_file, 'info'):
-                duration = int(audio_file.info.length)
-                bitrate = getattr(audio_file.info, 'bitrate', 0)
-                info = f"{duration}s_{bitrate}kbps"
-                if self.logger:
-                    self.logger.log_main('INFO', f"Audio info extracted: {os.path.basename(file_path)} - {info}")
-                return info
-            return "unknown"
-        except Exception as e:
-            if self.logger:
-                self.logger.log_main('WARNING', f"Could not extract audio info for {os.path.basename(file_path)}: {str(e)}")
-            return "unknown"
+        return self._record_info('Audio', file_path, *_extract_info(('Audio', file_path)))
     
     def get_document_info(self, file_path: str) -> str:
         """Get basic document information"""
-        ext = Path(file_path).suffix.lower()
-        try:
-            info = "document"
-            if ext == '.pdf':
-                with open(file_path, 'rb') as f:
-                    reader = PyPDF2.PdfReader(f)
-                    info = f"{len(reader.pages)}pages"
-            elif ext in ['.docx', '.doc']:
-                doc = docx.Document(file_path)
-                info = f"{len(doc.paragraphs)}paragraphs"
-            elif ext in ['.pptx', '.ppt']:
-                prs = Presentation(file_path)
-                info = f"{len(prs.slides)}slides"
-            elif ext == '.txt':
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = len(f.readlines())
-                    info = f"{lines}lines"
-            
-            if self.logger and info != "document":
-                self.logger.log_main('INFO', f"Document info extracted: {os.path.basename(file_path)} - {info}")
-            return info
-        except Exception as e:
-            if self.logger:
-                self.logger.log_main('WARNING', f"Could not extract document info for {os.path.basename(file_path)}: {str(e)}")
-            return "document"
+        mapped = self._mmap_cache.get(file_path)
+        return self._record_info('Documents', file_path, *_extract_info(('Documents', file_path), mapped))
     
-    def create_organized_filename(self, file_path: str, category: str) -> str:
+    def create_organized_filename(self, file_path: str, category: str,
+                                  format_type: Optional[str] = None,
+                                  info: Optional[str] = None,
+                                  name_parts: Optional[Tuple[str, str]] = None) -> str:
         """Create an organized filename with metadata info"""
-        original_name = Path(file_path).stem
-        extension = Path(file_path).suffix  # Keep original case of extension
+        # (stem, extension) as already split by the caller - keep original case of extension
+        original_name, extension = name_parts or os.path.splitext(os.path.basename(file_path))
         
         # Ensure extension exists
         if not extension:
-            # Try to determine extension from detected format
-            _, format_type, _ = self.detect_file_type(file_path)
+            # Try to determine extension from detected format - callers normally pass it in
+            if format_type is None:
+                detection = self._detect_cache.get(file_path)
+                format_type = detection.format_type if detection else self.detect_file_type(file_path)[1]
             if format_type and format_type != 'unknown':
                 extension = f".{format_type}"
             else:
                 extension = ".unknown"
         
-        # Get file info based on category
-        info = ""
-        if category == 'Images':
-            info = self.get_image_info(file_path)
-        elif category == 'Videos':
-            info = self.get_video_info(file_path)
-        elif category == 'Audio':
-            info = self.get_audio_info(file_path)
-        elif category == 'Documents':
-            info = self.get_document_info(file_path)
+        # Get file info based on category, unless it was extracted ahead of time
+        if info is None:
+            extract = self._category_info.get(category)
+            info = extract(file_path) if extract else ""
         
         # Create organized filename - ALWAYS include extension
         if info and info != "unknown":
@@ -359,110 +883,329 @@ class FileProcessor:
         else:
             new_filename = f"{original_name}{extension}"
         
-        if self.logger:
-            self.logger.log_main('INFO', f"Filename created: {os.path.basename(file_path)} -> {new_filename}")
+        if self.logger and self.logger.main_logger.isEnabledFor(logging.INFO):
+            self.logger.main_logger.info("Filename created: %s -> %s", os.path.basename(file_path), new_filename)
         
         return new_filename
     
+    def _iter_files(self, folder: str) -> Iterator[os.DirEntry]:
+        """Yield a DirEntry for every file in folder and all its subfolders"""
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            yield from self._iter_files(entry.path)
+                    else:
+                        yield entry
+        except OSError as e:
+            if self.logger:
+                self.logger.main_logger.warning("Could not scan folder %s: %s", folder, e)
+    
+    def _folder_lock(self, dest_folder: str) -> threading.Lock:
+        """Return the lock guarding duplicate-name handling in dest_folder"""
+        # There are only a handful of destination folders, so after the first file in each
+        # the lock is found without taking the guard
+        lock = self._folder_locks.get(dest_folder)
+        if lock is None:
+            with self._folder_locks_guard:
+                lock = self._folder_locks.setdefault(dest_folder, threading.Lock())
+        return lock
+    
+    def _process_one(self, file_path: str, output_folder: str, organize_by_type: bool,
+                     add_metadata_to_filename: bool,
+                     info: Optional[str] = None,
+                     use_links: bool = False) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Detect, rename and copy one file - returns (category, dest_path, error_or_None)"""
+        try:
+            # Split the path once - everything below reuses these pieces
+            original_filename = os.path.basename(file_path)
+            original_name, original_extension = os.path.splitext(original_filename)
+            ext = original_extension.lower()
+            
+            detection = self._detect_cache.get(file_path)
+            # Without metadata only the category matters, and a known extension gives it
+            # without opening the file; anything else goes through magic-byte detection
+            category = None if add_metadata_to_filename else self._EXT_TO_CATEGORY.get(ext)
+            if detection:
+                # Already detected while prefetching metadata
+                category, format_type = detection.category, detection.format_type
+            elif category:
+                format_type = ext[1:]
+                if self.logger:
+                    st = self._stat_cache.get(file_path)
+                    self.logger.log_file_detection(
+                        original_filename, file_path, category, format_type,
+                        "file_extension", st.st_size if st else os.path.getsize(file_path)
+                    )
+            else:
+                category, format_type, detection_method = self.detect_file_type(
+                    file_path, keep_mapping=add_metadata_to_filename)
+            
+            # Create destination folder
+            if organize_by_type:
+                dest_folder = os.path.join(output_folder, category)
+            else:
+                dest_folder = output_folder
+            
+            # Create filename (with or without metadata) - ALWAYS preserve extension
+            # Ensure extension exists
+            if not original_extension:
+                # Try to determine extension from detected format
+                if format_type and format_type != 'unknown':
+                    original_extension = f".{format_type}"
+                else:
+                    original_extension = ".unknown"
+            
+            if add_metadata_to_filename:
+                new_filename = self.create_organized_filename(file_path, category, format_type, info,
+                                                              (original_name, original_extension))
+            else:
+                # Even without metadata, ensure extension is preserved
+                new_filename = f"{original_name}{original_extension}"
+            
+            # Handle duplicate filenames - the folder lock covers the check and the reservation
+            with self._folder_lock(dest_folder):
+                # List each destination folder once, instead of probing every candidate name on disk
+                contents = self._dir_contents.get(dest_folder)
+                if contents is None:
+                    os.makedirs(dest_folder, exist_ok=True)
+                    contents = self._dir_contents[dest_folder] = set(os.listdir(dest_folder))
+                
+                if new_filename in contents:
+                    key = (dest_folder, new_filename)
+                    counter = self._next_suffix.get(key, 1)
+                    base_name, ext = os.path.splitext(new_filename)
+                    
+                    new_filename = f"{base_name}_{counter}{ext}"
+                    while new_filename in contents:
+                        counter += 1
+                        new_filename = f"{base_name}_{counter}{ext}"
+                    
+                    self._next_suffix[key] = counter + 1
+                
+                # Claim the name so other threads see it before the copy finishes
+                contents.add(new_filename)
+                dest_path = os.path.join(dest_folder, new_filename)
+            
+            # Copy the file
+            try:
+                fast_copy(file_path, dest_path, use_links)
+            except Exception:
+                # Don't leave a partial copy behind
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
+                raise
+            
+            if self.logger:
+                self.logger.main_logger.info("File processed: %s -> %s", original_filename, dest_path)
+            
+            return category, dest_path, None
+            
+        except Exception as e:
+            return None, None, str(e)
+        
+        finally:
+            # The cached detection, stat and mapping are only needed while this file is being processed
+            self._detect_cache.pop(file_path, None)
+            self._stat_cache.pop(file_path, None)
+            self._release_mapping(file_path)
+    
+    def _prefetch_metadata(self, files: List[str], processes: int,
+                           workers: Optional[int] = None,
+                           cancel_event: Optional[threading.Event] = None,
+                           progress_callback=None) -> Dict[str, str]:
+        """Detect files on threads, then extract their metadata per category in worker processes"""
+        # The detections stay in _detect_cache for _process_one; the mappings would only sit
+        # unused, since the worker processes open the files themselves
+        def detect(file_path: str) -> Optional[Tuple[str, str, str]]:
+            # Once stopped, the remaining files are skipped rather than detected
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            return self.detect_file_type(file_path)
+        
+        with ThreadPoolExecutor(max_workers=workers or _DEFAULT_WORKERS) as executor:
+            detections = list(executor.map(detect, files))
+        
+        if cancel_event is not None and cancel_event.is_set():
+            return {}
+        
+        # Group by category so each chunk sent to a worker uses a single extractor
+        by_category = defaultdict(list)
+        for file_path, (category, _, _) in zip(files, detections):
+            if category in _INFO_EXTRACTORS:
+                by_category[category].append(file_path)
+        
+        tasks = [(category, file_path) for category, paths in by_category.items() for file_path in paths]
+        
+        # Only metadata prefetching uses processes, so multiprocessing is imported here, not at startup
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+        
+        infos = {}
+        try:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                for i, ((category, file_path), (info, error)) in enumerate(zip(
+                        tasks, executor.map(_extract_info, tasks, chunksize=32))):
+                    infos[file_path] = self._record_info(category, file_path, info, error)
+                    
+                    if progress_callback:
+                        progress_callback(i + 1, len(tasks), f"reading metadata - {os.path.basename(file_path)}")
+                    
+                    if cancel_event is not None and cancel_event.is_set():
+                        executor.shutdown(cancel_futures=True)
+                        break
+        except BrokenProcessPool as e:
+            # A worker died (e.g. a decoder crashed on a bad file) - files without prefetched
+            # info have it extracted on the copy threads instead
+            if self.logger:
+                self.logger.main_logger.warning("Metadata worker process failed, extracting the remaining "
+                                                "%d files in-process: %s", len(tasks) - len(infos), e)
+        
+        return infos
+    
     def process_and_organize_files(self, input_folder: str, output_folder: str, 
                                  organize_by_type: bool = True, 
                                  add_metadata_to_filename: bool = True,
-                                 progress_callback=None) -> Dict:
+                                 progress_callback=None,
+                                 workers: Optional[int] = None,
+                                 metadata_processes: Optional[int] = None,
+                                 use_links: bool = False,
+                                 batch_callback=None,
+                                 cancel_event: Optional[threading.Event] = None) -> Dict:
         """Process files and organize them in output folder"""
         if self.logger:
-            self.logger.log_main('INFO', f"Starting file processing - Input: {input_folder}, Output: {output_folder}")
-            self.logger.log_main('INFO', f"Options - Organize by type: {organize_by_type}, Add metadata: {add_metadata_to_filename}")
+            self.logger.main_logger.info("Starting file processing - Input: %s, Output: %s",
+                                         input_folder, output_folder)
+            self.logger.main_logger.info("Options - Organize by type: %s, Add metadata: %s, Use links: %s",
+                                         organize_by_type, add_metadata_to_filename, use_links)
         
+        # Counters only - per-file errors beyond the most recent ones live in the main log
         results = {
             'total_files': 0,
             'processed_files': 0,
-            'errors': [],
-            'categories': {}
+            'error_count': 0,
+            'errors': deque(maxlen=_MAX_KEPT_ERRORS),
+            'categories': Counter(),
+            'cancelled': False
         }
         
+        # Hard links only work within one filesystem, so compare the devices once for the whole run
+        if use_links:
+            os.makedirs(output_folder, exist_ok=True)
+            use_links = os.stat(input_folder).st_dev == os.stat(output_folder).st_dev
+        
+        # Folder listings from an earlier run may be stale
+        self._dir_contents.clear()
+        self._next_suffix.clear()
+        self._stat_cache.clear()
+        
         files = []
         
-        # Collect all files
-        for root, dirs, filenames in os.walk(input_folder):
-            for filename in filenames:
-                files.append(os.path.join(root, filename))
+        # Collect all files, keeping the stat each DirEntry already has (or caches) for detection
+        for entry in self._iter_files(input_folder):
+            files.append(entry.path)
+            try:
+                self._stat_cache[entry.path] = entry.stat()
+            except OSError:
+                # e.g. a broken symlink - detection reports the error
+                pass
         
         results['total_files'] = len(files)
         
+        # Large runs amortise numba's import and compile time; otherwise the first-byte index is used
+        self._scanner = _numba_scanner() if len(files) >= _NUMBA_MIN_FILES else None
+        
         if self.logger:
-            self.logger.log_main('INFO', f"Found {len(files)} files to process")
+            self.logger.main_logger.info("Found %d files to process", len(files))
         
-        for i, file_path in enumerate(files):
-            try:
-                if progress_callback:
-                    progress_callback(i + 1, len(files), os.path.basename(file_path))
-                
-                # Detect file type
-                category, format_type, detection_method = self.detect_file_type(file_path)
-                
-                # Create destination folder
-                if organize_by_type:
-                    dest_folder = os.path.join(output_folder, category)
-                else:
-                    dest_folder = output_folder
-                
-                os.makedirs(dest_folder, exist_ok=True)
-                
-                # Create filename (with or without metadata) - ALWAYS preserve extension
-                original_filename = os.path.basename(file_path)
-                original_name = Path(file_path).stem
-                original_extension = Path(file_path).suffix
-                
-                # Ensure extension exists
-                if not original_extension:
-                    # Try to determine extension from detected format
-                    if format_type and format_type != 'unknown':
-                        original_extension = f".{format_type}"
-                    else:
-                        original_extension = ".unknown"
-                
-                if add_metadata_to_filename:
-                    new_filename = self.create_organized_filename(file_path, category)
-                else:
-                    # Even without metadata, ensure extension is preserved
-                    new_filename = f"{original_name}{original_extension}"
-                
-                # Handle duplicate filenames
-                dest_path = os.path.join(dest_folder, new_filename)
-                counter = 1
-                base_name, ext = os.path.splitext(new_filename)
-                
-                while os.path.exists(dest_path):
-                    new_filename = f"{base_name}_{counter}{ext}"
-                    dest_path = os.path.join(dest_folder, new_filename)
-                    counter += 1
-                
-                # Copy the file
-                shutil.copy2(file_path, dest_path)
-                
-                if self.logger:
-                    self.logger.log_main('INFO', f"File processed: {original_filename} -> {dest_path}")
-                
-                # Update statistics
-                if category not in results['categories']:
-                    results['categories'][category] = 0
-                results['categories'][category] += 1
-                results['processed_files'] += 1
-                
-            except Exception as e:
-                error_info = {
-                    'file_path': file_path,
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+        # Large runs extract all metadata up front in worker processes, so PIL/cv2 work runs outside
+        # the GIL (metadata_processes=None picks this automatically, 0 turns it off)
+        if metadata_processes is None and len(files) >= _PROCESS_METADATA_MIN_FILES:
+            metadata_processes = os.cpu_count() or 1
+        
+        try:
+            infos = {}
+            if add_metadata_to_filename and metadata_processes and not (cancel_event and cancel_event.is_set()):
+                infos = self._prefetch_metadata(files, metadata_processes, workers, cancel_event,
+                                                progress_callback)
+            
+            # Stopped while scanning or prefetching - start no copies (and no new pool, which
+            # fails anyway once the interpreter is shutting down)
+            if cancel_event is not None and cancel_event.is_set():
+                results['cancelled'] = True
+                files_to_process = []
+            else:
+                files_to_process = files
+            
+            # Files are independent and the work is mostly I/O, so run them on a thread pool
+            with ThreadPoolExecutor(max_workers=workers or _DEFAULT_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._process_one, file_path, output_folder,
+                                    organize_by_type, add_metadata_to_filename,
+                                    infos.get(file_path), use_links): file_path
+                    for file_path in files_to_process
                 }
-                results['errors'].append(error_info)
                 
-                if self.logger:
-                    self.logger.log_main('ERROR', f"Error processing file {file_path}: {str(e)}")
+                for i, future in enumerate(as_completed(futures)):
+                    # Drop each future once handled so finished results don't pile up
+                    file_path = futures.pop(future)
+                    name = os.path.basename(file_path)
+                    category, dest_path, error = future.result()
+                    
+                    if progress_callback:
+                        progress_callback(i + 1, len(files), name)
+                    
+                    if error is None:
+                        # Update statistics
+                        results['categories'][category] += 1
+                        results['processed_files'] += 1
+                    else:
+                        # No timestamp here - the main log already records when the error was logged
+                        error_info = {
+                            'file_path': file_path,
+                            'name': name,
+                            'error': error
+                        }
+                        results['errors'].append(error_info)
+                        results['error_count'] += 1
+                        
+                        if self.logger:
+                            self.logger.main_logger.error("Error processing file %s: %s", file_path, error)
+                    
+                    if batch_callback and (i + 1) % _BATCH_SIZE == 0:
+                        batch_callback({
+                            'done': i + 1,
+                            'total': len(files),
+                            'processed_files': results['processed_files'],
+                            'error_count': results['error_count'],
+                            'categories': dict(results['categories'])
+                        })
+                    
+                    if cancel_event is not None and cancel_event.is_set():
+                        # Files not started yet are dropped; the ones already being copied finish first
+                        for pending in futures:
+                            pending.cancel()
+                        results['cancelled'] = True
+                        break
+        finally:
+            # Detections and mappings belong to this run - a stopped run leaves some behind,
+            # and a later run over the same paths must not reuse them
+            self._detect_cache.clear()
+            with self._mmap_lock:
+                mappings, self._mmap_cache = list(self._mmap_cache.values()), OrderedDict()
+            for mapped in mappings:
+                mapped.close()
+        
+        results['errors'] = list(results['errors'])
         
         if self.logger:
-            self.logger.log_main('INFO', f"Processing completed - {results['processed_files']} files processed, {len(results['errors'])} errors")
+            self.logger.main_logger.info("Processing %s - %d files processed, %d errors",
+                                         "cancelled" if results['cancelled'] else "completed",
+                                         results['processed_files'], results['error_count'])
             self.logger.create_summary_log(results)
+            self.logger.flush()
         
         return results
 
@@ -478,20 +1221,38 @@ class FileOrganizerGUI:
         self.output_folder = tk.StringVar()
         self.organize_by_type = tk.BooleanVar(value=True)
         self.add_metadata_to_filename = tk.BooleanVar(value=True)
+        self.use_links = tk.BooleanVar(value=False)
         self.processing = False
         
+        # Log line timestamp, only reformatted when the second changes
+        self._stamp_second = None
+        self._stamp = ""
+        
+        # Log lines, progress and widget calls queued by any thread, applied on the Tk thread by a timer
+        self._pending_lines = []
+        self._pending_progress = None
+        self._pending_calls = []
+        self._log_lock = threading.Lock()
+        self._last_progress_update = 0
+        
+        # One long-lived worker thread runs every job, instead of a new thread per run
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='organizer')
+        self._future = None
+        self._cancel_event = None
+        
         self.setup_gui()
+        self.root.after(50, self._flush_log)
         
         # Log application start
-        self.logger.log_main('INFO', 'File Organizer application started')
+        self.logger.main_logger.info('File Organizer application started')
         self.log(f"📝 Logging enabled - Log files location: {self.logger.log_directory}")
-        self.log(f"📝 Main log: {os.path.basename(self.logger.main_log_file)}")
-        self.log(f"📝 Detection log: {os.path.basename(self.logger.detection_log_file)}")
+        self.log(f"📝 Main log: {self.logger.main_log_name}")
+        self.log(f"📝 Detection log: {self.logger.detection_log_name}")
     
     def setup_gui(self):
         """Setup the GUI interface"""
         self.root.title("Professional File Organizer & Processor")
-        self.root.geometry("950x800")
+        self.root.geometry(f"{_WINDOW_WIDTH}x{_WINDOW_HEIGHT}")
         self.root.configure(bg='#f0f0f0')
         
         # Configure styles
@@ -544,6 +1305,9 @@ class FileOrganizerGUI:
         ttk.Checkbutton(options_frame, text="Add metadata info to filenames (size, duration, etc.)",
                        variable=self.add_metadata_to_filename).grid(row=1, column=0, sticky=tk.W, pady=2)
         
+        ttk.Checkbutton(options_frame, text="Use hardlink/reflink when possible (same drive only, linked files share edits)",
+                       variable=self.use_links).grid(row=2, column=0, sticky=tk.W, pady=2)
+        
         # Control buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.grid(row=6, column=0, columnspan=3, pady=(0, 20))
@@ -614,7 +1378,7 @@ class FileOrganizerGUI:
         if folder:
             self.input_folder.set(folder)
             self.log(f"✅ Input folder selected: {folder}")
-            self.logger.log_main('INFO', f"Input folder selected: {folder}")
+            self.logger.main_logger.info("Input folder selected: %s", folder)
     
     def select_output_folder(self):
         """Select output folder"""
@@ -622,7 +1386,7 @@ class FileOrganizerGUI:
         if folder:
             self.output_folder.set(folder)
             self.log(f"✅ Output folder selected: {folder}")
-            self.logger.log_main('INFO', f"Output folder selected: {folder}")
+            self.logger.main_logger.info("Output folder selected: %s", folder)
     
     def open_output_folder(self):
         """Open output folder in file explorer"""
@@ -651,11 +1415,59 @@ class FileOrganizerGUI:
             messagebox.showwarning("Warning", "Log folder doesn't exist")
     
     def log(self, message):
-        """Add message to log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.root.update()
+        """Add message to log (queued, safe to call from the worker thread)"""
+        now = int(time.time())
+        with self._log_lock:
+            if now != self._stamp_second:
+                self._stamp_second = now
+                self._stamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._pending_lines.append(f"[{self._stamp}] {message}\n")
+    
+    def set_progress(self, progress=None, status=None):
+        """Queue a progress bar value and/or status text (None leaves it unchanged)"""
+        with self._log_lock:
+            if self._pending_progress:
+                pending_value, pending_status = self._pending_progress
+                progress = pending_value if progress is None else progress
+                status = pending_status if status is None else status
+            self._pending_progress = (progress, status)
+    
+    def call_in_gui(self, func, *args, **kwargs):
+        """Queue a widget call (dialogs, button states) to run on the Tk thread"""
+        with self._log_lock:
+            self._pending_calls.append(functools.partial(func, *args, **kwargs))
+    
+    def _flush_log(self):
+        """Write queued log lines and the latest progress to the widgets in one go, every 50 ms"""
+        with self._log_lock:
+            lines, self._pending_lines = self._pending_lines, []
+            pending_progress, self._pending_progress = self._pending_progress, None
+            calls, self._pending_calls = self._pending_calls, []
+        
+        if lines:
+            self.log_text.insert(tk.END, ''.join(lines))
+            # A Text widget gets slower with every line it holds, so trim the oldest ones
+            # (every line ends in a newline, so the last line index is an empty line)
+            excess = int(self.log_text.index('end-1c').split('.')[0]) - 1 - _LOG_WIDGET_MAX_LINES
+            if excess > 0:
+                self.log_text.delete('1.0', f'{excess + 1}.0')
+            self.log_text.see(tk.END)
+        
+        if pending_progress:
+            progress, status = pending_progress
+            if progress is not None:
+                self.progress_var.set(progress)
+            if status is not None:
+                self.status_var.set(status)
+        
+        if lines or pending_progress:
+            self.root.update_idletasks()
+        
+        # Posted rather than called, so a modal dialog among them can't hold up this drain loop
+        for call in calls:
+            self.root.after_idle(call)
+        
+        self.root.after(50, self._flush_log)
     
     def clear_log(self):
         """Clear the log"""
@@ -664,151 +1476,208 @@ class FileOrganizerGUI:
     
     def update_progress(self, current, total, filename):
         """Update progress bar and status"""
-        progress = (current / total) * 100
-        self.progress_var.set(progress)
-        self.status_var.set(f"Processing {current}/{total}: {filename}")
-        self.log(f"🔄 Processing: {filename}")
+        # Copying restarts the count after the metadata prefetch pass
+        if current < self._last_progress_update:
+            self._last_progress_update = 0
+        # Only move the bar in steps of about 0.5%, smaller steps aren't visible
+        if current - self._last_progress_update >= max(1, total // 200) or current == total:
+            self._last_progress_update = current
+            self.set_progress((current / total) * 100, f"Processing {current}/{total}: {filename}")
+        # No log line per file - the status line names the current file and report_batch logs running totals
+    
+    def report_batch(self, stats: Dict):
+        """Log running totals for each completed batch of files"""
+        self.log(f"📦 {stats['done']}/{stats['total']} files done - "
+                 f"{stats['processed_files']} organized, {stats['error_count']} errors")
     
     def start_processing(self):
         """Start the processing in a separate thread"""
-        if not self.input_folder.get():
+        # Snapshot the settings once - the worker never touches the Tk variables,
+        # and edits made while it runs don't affect the current job
+        input_folder = self.input_folder.get()
+        output_folder = self.output_folder.get()
+        organize_by_type = self.organize_by_type.get()
+        add_metadata_to_filename = self.add_metadata_to_filename.get()
+        use_links = self.use_links.get()
+        
+        if not input_folder:
             messagebox.showerror("Error", "Please select an input folder")
             return
         
-        if not self.output_folder.get():
+        if not output_folder:
             messagebox.showerror("Error", "Please select an output folder")
             return
         
-        if not os.path.exists(self.input_folder.get()):
+        if not os.path.exists(input_folder):
             messagebox.showerror("Error", "Input folder does not exist")
             return
         
         # Create output folder if it doesn't exist
-        os.makedirs(self.output_folder.get(), exist_ok=True)
+        os.makedirs(output_folder, exist_ok=True)
         
         self.processing = True
+        self._last_progress_update = 0
         self.start_button.config(state='disabled')
         self.stop_button.config(state='normal')
         
         self.log(f"🚀 Starting file processing and organization...")
-        self.log(f"📋 Options: Organize by type = {self.organize_by_type.get()}")
-        self.log(f"📋 Options: Add metadata to filenames = {self.add_metadata_to_filename.get()}")
+        self.log(f"📋 Options: Organize by type = {organize_by_type}")
+        self.log(f"📋 Options: Add metadata to filenames = {add_metadata_to_filename}")
+        self.log(f"📋 Options: Use hardlink/reflink = {use_links}")
         self.log(f"📋 All files will keep their original extensions for proper viewing")
         self.log(f"📝 Detailed logs are being saved to: {self.logger.log_directory}")
         
-        self.logger.log_main('INFO', 'Starting file processing session')
+        self.logger.main_logger.info('Starting file processing session')
         
-        # Start processing in a separate thread
-        thread = threading.Thread(target=self.process_files)
-        thread.daemon = True
-        thread.start()
+        # Start processing on the worker thread, with a fresh event the Stop button and shutdown can set
+        self._cancel_event = threading.Event()
+        self._future = self._executor.submit(self.process_files, input_folder, output_folder,
+                                             organize_by_type, add_metadata_to_filename, use_links,
+                                             self._cancel_event)
+        self._future.add_done_callback(self._processing_done)
     
-    def process_files(self):
+    def process_files(self, input_folder: str, output_folder: str, organize_by_type: bool,
+                      add_metadata_to_filename: bool, use_links: bool,
+                      cancel_event: Optional[threading.Event] = None):
         """Process files in background thread"""
         try:
             results = self.processor.process_and_organize_files(
-                self.input_folder.get(),
-                self.output_folder.get(),
-                self.organize_by_type.get(),
-                self.add_metadata_to_filename.get(),
-                self.update_progress
+                input_folder,
+                output_folder,
+                organize_by_type,
+                add_metadata_to_filename,
+                self.update_progress,
+                use_links=use_links,
+                batch_callback=self.report_batch,
+                cancel_event=cancel_event
             )
             
+            if results['cancelled']:
+                self.log(f"⏹️ Processing stopped after {results['processed_files']} of "
+                         f"{results['total_files']} files")
+                self.set_progress(status="Processing stopped")
+                return
+            
             self.log(f"✅ Processing completed!")
             self.log(f"📊 Total files: {results['total_files']}")
             self.log(f"✔️ Successfully processed: {results['processed_files']}")
             
             # Log category statistics
-            for category, count in results['categories'].items():
+            for category, count in results['categories'].most_common():
                 self.log(f"   📁 {category}: {count} files")
             
-            if results['errors']:
-                self.log(f"❌ Errors encountered: {len(results['errors'])}")
-                for error in results['errors']:
-                    self.log(f"   Error: {Path(error['file_path']).name} - {error['error']}")
+            errors = results['errors']
+            if errors:
+                # One queued entry for the whole listing, capped so a badly failing run can't flood the widget
+                shown = errors[:_MAX_SHOWN_ERRORS]
+                lines = [f"❌ Errors encountered: {results['error_count']}"]
+                lines += [f"   Error: {error['name']} - {error['error']}" for error in shown]
+                if results['error_count'] > len(shown):
+                    lines.append(f"   ... {results['error_count'] - len(shown)} more - see {self.logger.main_log_name}")
+                self.log("\n".join(lines))
             
-            self.status_var.set("Processing completed successfully!")
+            self.set_progress(status="Processing completed successfully!")
             
             # Show completion dialog
-            message = f"Processing completed!\n\n"
-            message += f"Total files: {results['total_files']}\n"
-            message += f"Successfully processed: {results['processed_files']}\n"
-            if results['errors']:
-                message += f"Errors: {len(results['errors'])}\n"
-            message += f"\nFiles organized in: {self.output_folder.get()}\n"
-            message += f"Logs saved in: {self.logger.log_directory}\n\n"
-            message += f"Log files created:\n"
-            message += f"• Main log: {os.path.basename(self.logger.main_log_file)}\n"
-            message += f"• Detection log: {os.path.basename(self.logger.detection_log_file)}\n"
-            message += f"• Summary log: processing_summary_*.log"
-            
-            messagebox.showinfo("Success", message)
+            self.call_in_gui(self.show_completion, results, output_folder)
             
         except Exception as e:
             self.log(f"❌ Error during processing: {str(e)}")
-            self.logger.log_main('ERROR', f"Fatal error during processing: {str(e)}")
-            messagebox.showerror("Error", f"An error occurred: {str(e)}")
-        
-        finally:
-            self.processing = False
-            self.start_button.config(state='normal')
-            self.stop_button.config(state='disabled')
-            self.progress_var.set(0)
+            self.logger.main_logger.error("Fatal error during processing: %s", e)
+            self.call_in_gui(messagebox.showerror, "Error", f"An error occurred: {str(e)}")
+    
+    def _processing_done(self, future):
+        """Reset the controls once a job has finished, however it ended"""
+        # Records still buffered (e.g. after a fatal error) are written out now
+        self.logger.flush()
+        self.processing = False
+        self.call_in_gui(self.start_button.config, state='normal')
+        self.call_in_gui(self.stop_button.config, state='disabled')
+        self.set_progress(0)
+    
+    def shutdown(self):
+        """Stop any running job, release the worker thread and close the logs once the job has ended"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._future is not None:
+            # Runs right away if the job is already done
+            self._future.add_done_callback(lambda _: self.logger.close())
+        else:
+            self.logger.close()
+    
+    def show_completion(self, results: Dict, output_folder: str):
+        """Show the completion dialog (runs on the Tk thread)"""
+        parts = [
+            "Processing completed!",
+            "",
+            f"Total files: {results['total_files']}",
+            f"Successfully processed: {results['processed_files']}",
+        ]
+        if results['errors']:
+            parts.append(f"Errors: {results['error_count']}")
+        parts += [
+            "",
+            f"Files organized in: {output_folder}",
+            f"Logs saved in: {self.logger.log_directory}",
+            "",
+            "Log files created:",
+            f"• Main log: {self.logger.main_log_name}",
+            f"• Detection log: {self.logger.detection_log_name}",
+            "• Summary log: processing_summary_*.log",
+        ]
+        
+        messagebox.showinfo("Success", "\n".join(parts))
     
     def stop_processing(self):
         """Stop the processing"""
         self.processing = False
+        if self._cancel_event is not None:
+            self._cancel_event.set()
         self.log("⏹️ Processing stopped by user")
-        self.logger.log_main('WARNING', 'Processing stopped by user')
-        self.status_var.set("Processing stopped")
+        self.logger.main_logger.warning('Processing stopped by user')
+        self.set_progress(status="Processing stopped")
 
 
 def main():
     """Main function to run the application"""
-    # Check if required packages are installed
-    required_packages = {
-        'Pillow': 'PIL',
-        'PyPDF2': 'PyPDF2',
-        'python-docx': 'docx',
-        'python-pptx': 'pptx',
-        'opencv-python': 'cv2',
-        'mutagen': 'mutagen'
-    }
-    
-    missing_packages = []
-    
-    for package_name, import_name in required_packages.items():
-        try:
-            __import__(import_name)
-        except ImportError:
-            missing_packages.append(package_name)
+    # Check if required packages are installed - find_spec only locates them,
+    # they are imported later, when first needed
+    missing_packages = [package_name for package_name, import_name in _REQUIRED_PACKAGES
+                        if importlib.util.find_spec(import_name) is None]
     
     if missing_packages:
         print("❌ Missing required packages. Please install them using:")
         print(f"pip install {' '.join(missing_packages)}")
-        input("Press Enter to exit...")
-        return
+        # Keep a double-clicked console window open, but never wait on stdin in scripts or CI
+        if sys.stdin.isatty() and sys.stdout.isatty() and not os.environ.get("CI"):
+            input("Press Enter to exit...")
+        sys.exit(1)
     
     # Create and run the GUI
     root = tk.Tk()
     app = FileOrganizerGUI(root)
     
-    # Center the window
-    root.update_idletasks()
-    x = (root.winfo_screenwidth() // 2) - (root.winfo_width() // 2)
-    y = (root.winfo_screenheight() // 2) - (root.winfo_height() // 2)
+    # Center the window - the screen size is known without waiting for the layout to settle
+    x = (root.winfo_screenwidth() - _WINDOW_WIDTH) // 2
+    y = (root.winfo_screenheight() - _WINDOW_HEIGHT) // 2
     root.geometry(f'+{x}+{y}')
     
     try:
         root.mainloop()
     except Exception as e:
         if hasattr(app, 'logger'):
-            app.logger.log_main('ERROR', f"Application error: {str(e)}")
+            app.logger.main_logger.error("Application error: %s", e)
         print(f"Application error: {str(e)}")
     finally:
         if hasattr(app, 'logger'):
-            app.logger.log_main('INFO', 'File Organizer application closed')
+            app.logger.main_logger.info('File Organizer application closed')
+            app.shutdown()
 
 
 if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Frozen executables must let metadata worker processes start up as workers, not as the GUI
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
\ No newline at end of file